@@ -16,6 +16,9 @@ setup(
             "behave",
             "flake8",
         ],
+        "fast": [
+            "orjson",
+        ],
     },
     version="3.1.0",
     entry_points={
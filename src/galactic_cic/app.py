@@ -2,11 +2,14 @@
 
 import asyncio
 import curses
+import heapq
 import locale
+import logging
 import time
 import threading
-from collections import namedtuple
+from collections import deque, namedtuple
 from datetime import datetime, timezone
+from operator import itemgetter
 
 from galactic_cic.data.collectors import (
     get_agents_data,
@@ -28,11 +31,13 @@ from galactic_cic.data.collectors import (
     get_channels_status,
     get_update_status,
     build_action_items,
+    clear_command_cache,
 )
 from galactic_cic.db.database import MetricsDB
 from galactic_cic.db.recorder import MetricsRecorder
 from galactic_cic.db.trends import TrendCalculator
 from galactic_cic import theme
+from galactic_cic.panels.base import BasePanel
 from galactic_cic.panels.agents import AgentFleetPanel
 from galactic_cic.panels.server import ServerHealthPanel
 from galactic_cic.panels.cron import CronJobsPanel
@@ -40,6 +45,58 @@ from galactic_cic.panels.security import SecurityPanel
 from galactic_cic.panels.activity import ActivityLogPanel
 from galactic_cic.panels.sitrep import SitrepPanel
 
+# Writing to stderr would corrupt the curses screen, so keep the stdlib's
+# last-resort handler out of it; records surface only if the embedding
+# program configures a handler
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+try:
+    from zoneinfo import ZoneInfo
+    _CENTRAL = ZoneInfo("America/Chicago")
+except Exception:  # no tzdata on this system
+    _CENTRAL = None
+
+_TITLE = "CIC \u2014 Claw Information Center"
+
+
+def _button_row(*labels):
+    """(column, label) pairs for a footer row, two spaces apart."""
+    row, col = [], 1
+    for label in labels:
+        row.append((col, label))
+        col += len(label) + 2
+    return tuple(row)
+
+
+_DASHBOARD_BUTTONS = _button_row(
+    "[ q: Quit ]", "[ r: Refresh ]", "[ Tab: Cycle ]", "[ Enter: Detail ]",
+    "[ c: Config ]", "[ t: Theme ]", "[ ?: Help ]",
+)
+_DETAIL_BUTTONS = _button_row("[ Esc: Back ]", "[ q: Quit ]")
+
+
+def _with_hostnames(ssh_summary, host_map):
+    """Copy of an SSH login summary with resolved hostnames attached.
+
+    The collected summary stays untouched: it is what the next refresh is
+    compared against, and views already handed to the UI thread must not
+    change under it.
+    """
+    if not host_map or not isinstance(ssh_summary, dict):
+        return ssh_summary
+
+    def annotate(entries):
+        return [
+            dict(entry, hostname=host_map[entry["ip"]])
+            if entry.get("ip", "") in host_map else entry
+            for entry in entries
+        ]
+
+    return dict(ssh_summary,
+                accepted=annotate(ssh_summary.get("accepted", [])),
+                failed=annotate(ssh_summary.get("failed", [])))
+
 
 Binding = namedtuple("Binding", ["key", "action", "description"])
 
@@ -69,10 +126,53 @@ class CICDashboard:
     TIER_SLOW = 300      # agents, openclaw_status, security, ssh_login_summary
     TIER_GLACIAL = 900   # DNS resolution, geolocation, attacker scans
 
+    # Per-source TTL multipliers: a source whose data came back unchanged
+    # is polled at up to 2x its tier, one that keeps raising backs off
+    # exponentially up to 8x. Any change (or a manual refresh) resets it.
+    BACKOFF_UNCHANGED_MAX = 2
+    BACKOFF_ERROR_MAX = 8
+
+    # Enrichment lookups run concurrently, bounded so a large IP set cannot
+    # fork dozens of dig/nmap processes at once
+    MAX_PARALLEL_LOOKUPS = 32
+    MAX_PARALLEL_SCANS = 2
+
+    # A glacial tick whose IP set matches the last pass reuses its results
+    # for up to this long (the attacker scan cache TTL)
+    GLACIAL_REUSE_MAX = 6 * 3600
+
+    # (source_name, tier attribute, collector) for each tiered source
+    COLLECTORS = (
+        # FAST tier (30s) — lightweight, changes often
+        ("server_health", "TIER_FAST", get_server_health),
+        ("top_processes", "TIER_FAST", get_top_processes),
+        # MEDIUM tier (2 min) — moderate cost
+        ("cron_jobs", "TIER_MEDIUM", get_cron_jobs),
+        ("activity_log", "TIER_MEDIUM", get_activity_log),
+        ("openclaw_logs", "TIER_MEDIUM", lambda: get_openclaw_logs(limit=20)),
+        ("error_summary", "TIER_MEDIUM", get_error_summary),
+        ("network_activity", "TIER_MEDIUM", get_network_activity),
+        # SLOW tier (5 min) — expensive, rarely changes
+        ("agents_data", "TIER_SLOW", get_agents_data),
+        ("openclaw_status", "TIER_SLOW", get_openclaw_status),
+        ("security_status", "TIER_SLOW", get_security_status),
+        ("ssh_login_summary", "TIER_SLOW", get_ssh_login_summary),
+        ("channels_status", "TIER_SLOW", get_channels_status),
+        ("update_status", "TIER_SLOW", get_update_status),
+    )
+
     def __init__(self):
         self.stdscr = None
         self.running = False
         self.show_help_overlay = False
+        self._help_box = None
+        self._clock_second = None
+        self._clock = ("", "")
+        self._ct_hour = None  # UTC hour the cached Central offset is for
+        self._ct_offset = 0
+        self._data_gen = 0  # generation of the panel data last applied
+        self._layout_cache = None  # ((h, w), layout)
+        self._key_actions = self._build_key_actions()
         self.focused_panel = 0
 
         # Historical database
@@ -96,13 +196,23 @@ class CICDashboard:
 
         # Background data refresh state
         self._last_refresh_time = 0.0
-        self._refresh_lock = threading.Lock()
-        self._refresh_thread = None
+        # (generation, per-panel update args) published by the refresh
+        # thread; the UI thread applies it, see _apply_published
+        self._published = (0, None)
+        self._bg_loop = None  # long-lived loop on its own thread, see _background_loop
+        self._refresh_future = None
+        self._consec_failures = 0
         self._force_refresh = True  # force on startup
 
         # Tiered data collection state
-        self._collection_timestamps = {}  # source_name -> monotonic timestamp
+        # (next due monotonic time, source_name); all due at start
+        self._due_heap = [(0.0, source) for source, _, _ in self.COLLECTORS]
+        self._due_heap.append((0.0, "glacial_enrichment"))
+        # (IP set, monotonic time) of the last complete enrichment pass
+        self._last_glacial = None
+        heapq.heapify(self._due_heap)
         self._cached_data = {}            # source_name -> last collected result
+        self._backoff = {}                # source_name -> TTL multiplier
         self._force_all_tiers = True      # force all on startup
 
         # NMAP scanning flag (True while scans are active)
@@ -111,27 +221,20 @@ class CICDashboard:
         # Detail view state: None = dashboard, int = panel index, "config" = config page
         self._detail_view = None
 
-        # Rolling in-memory sparkline histories (one entry per FAST refresh)
+        # Rolling in-memory sparkline histories (one entry per FAST refresh);
+        # bounded deques drop the oldest point on append, no re-slicing
         self._HISTORY_MAX = 60
-        self._cpu_history, self._mem_history, self._disk_history, self._net_history = \
-            self._load_historical_sparklines()
+        self._cpu_history, self._mem_history, self._disk_history, self._net_history = (
+            deque(series, maxlen=self._HISTORY_MAX)
+            for series in self._load_historical_sparklines()
+        )
 
     def _load_historical_sparklines(self):
         """Pre-populate sparkline histories from SQLite on startup."""
         cpu, mem, disk, net = [], [], [], []
         try:
-            rows = self.db.get_recent_server_metrics(hours=1, limit=self._HISTORY_MAX)
-            # Rows are newest-first, reverse for chronological order
-            for row in reversed(rows):
-                cpu.append(row[0] or 0)
-                mem_used = row[1] or 0
-                mem_total = row[2] or 1
-                mem_pct = (mem_used / mem_total * 100) if mem_total > 0 else 0
-                disk_used = row[3] or 0
-                disk_total = row[4] or 1
-                disk_pct = (disk_used / disk_total * 100) if disk_total > 0 else 0
-                mem.append(mem_pct)
-                disk.append(disk_pct)
+            cols = self.db.get_recent_server_columns(hours=1, limit=self._HISTORY_MAX)
+            cpu, mem, disk = cols["cpu"], cols["mem"], cols["disk"]
         except Exception:
             pass
         try:
@@ -156,34 +259,53 @@ class CICDashboard:
         remaining = max(0, self.REFRESH_INTERVAL - elapsed)
         return int(remaining)
 
+    def _clock_strings(self):
+        """UTC and Central clock strings, formatted at most once per second.
+
+        The header is drawn every ~100ms but only shows whole seconds, so
+        the formatting is skipped until the second changes. Both clocks use
+        time.gmtime; Central time is UTC shifted by an offset that is only
+        looked up once per hour, since DST switches happen on the hour.
+        """
+        second = int(time.time())
+        if second != self._clock_second:
+            utc_str = time.strftime("%H:%M:%S UTC", time.gmtime(second))
+            if _CENTRAL is not None:
+                hour = second // 3600
+                if hour != self._ct_hour:
+                    now = datetime.fromtimestamp(second, timezone.utc)
+                    self._ct_offset = int(now.astimezone(_CENTRAL).utcoffset().total_seconds())
+                    self._ct_hour = hour
+                ct_str = time.strftime("%H:%M:%S CT", time.gmtime(second + self._ct_offset))
+            else:
+                ct_str = "??:??:?? CT"
+            self._clock_second = second
+            self._clock = (utc_str, ct_str)
+        return self._clock
+
     def _draw_header(self):
         """Draw header with real-time clock and refresh countdown."""
         h, w = self.stdscr.getmaxyx()
         header_attr = theme.get_attr(theme.HEADER)
 
+        # The row is blank after erase(); restyle it in place rather than
+        # writing a full-width run of spaces
         try:
-            self.stdscr.addnstr(0, 0, " " * w, w, header_attr)
+            self.stdscr.chgat(0, 0, w, header_attr)
         except curses.error:
             pass
 
-        title = "CIC \u2014 Claw Information Center"
+        title = _TITLE
         try:
             self.stdscr.addnstr(0, 2, title, w - 4, header_attr)
         except curses.error:
             pass
 
         # Real-time dual timezone clock + refresh countdown
-        now_utc = datetime.now(timezone.utc)
-        utc_str = now_utc.strftime("%H:%M:%S UTC")
-        try:
-            from zoneinfo import ZoneInfo
-            now_ct = now_utc.astimezone(ZoneInfo("America/Chicago"))
-            ct_str = now_ct.strftime("%H:%M:%S CT")
-        except Exception:
-            ct_str = "??:??:?? CT"
+        utc_str, ct_str = self._clock_strings()
 
         countdown = self._seconds_until_refresh()
-        is_refreshing = self._refresh_thread is not None and self._refresh_thread.is_alive()
+        is_refreshing = self._is_refreshing()
         if is_refreshing:
             status = "\u21bb"  # ↻ refreshing indicator
         else:
@@ -204,57 +326,65 @@ class CICDashboard:
         highlight_attr = theme.get_attr(theme.HIGHLIGHT)
 
         try:
-            self.stdscr.addnstr(footer_y, 0, " " * w, w, footer_attr)
+            self.stdscr.chgat(footer_y, 0, w, footer_attr)
         except curses.error:
             pass
 
         if self._detail_view is not None:
-            buttons = "[ Esc: Back ]  [ q: Quit ]"
+            buttons = _DETAIL_BUTTONS
         else:
-            buttons = "[ q: Quit ]  [ r: Refresh ]  [ Tab: Cycle ]  [ Enter: Detail ]  [ c: Config ]  [ t: Theme ]  [ ?: Help ]"
+            buttons = _DASHBOARD_BUTTONS
 
+        addnstr = self.stdscr.addnstr
         try:
-            col = 1
-            for btn in buttons.split("  "):
-                btn = btn.strip()
+            for col, btn in buttons:
                 if col + len(btn) >= w:
                     break
-                self.stdscr.addnstr(footer_y, col, btn, w - col, highlight_attr)
-                col += len(btn) + 2
+                addnstr(footer_y, col, btn, w - col, highlight_attr)
         except curses.error:
             pass
 
+    def _help_rows(self):
+        """Framed help overlay rows, built on first use — the text is static."""
+        if self._help_box is None:
+            help_lines = [
+                "GalacticCIC \u2014 Keyboard Controls",
+                "",
+                "  q          Quit",
+                "  r          Refresh all panels",
+                "  1-6        Focus panel",
+                "  Tab        Cycle panels (reading order)",
+                "  Shift+Tab  Cycle panels (reverse)",
+                "  Enter      Open detail view",
+                "  Esc        Back to dashboard",
+                "  c          Configuration page",
+                "  t          Cycle theme",
+                "  ?          Toggle this help",
+                "",
+                f"  Refresh every {self.REFRESH_INTERVAL}s",
+                "",
+                "Press any key to close",
+            ]
+            box_w = max(len(line) for line in help_lines) + 4
+            self._help_box = (
+                ["\u250c" + "\u2500" * (box_w - 2) + "\u2510"]
+                + [f"\u2502 {line:<{box_w - 4}} \u2502" for line in help_lines]
+                + ["\u2514" + "\u2500" * (box_w - 2) + "\u2518"]
+            )
+        return self._help_box
+
     def _draw_help_overlay(self):
         h, w = self.stdscr.getmaxyx()
-        help_lines = [
-            "GalacticCIC \u2014 Keyboard Controls",
-            "",
-            "  q          Quit",
-            "  r          Refresh all panels",
-            "  1-6        Focus panel",
-            "  Tab        Cycle panels (reading order)",
-            "  Shift+Tab  Cycle panels (reverse)",
-            "  Enter      Open detail view",
-            "  Esc        Back to dashboard",
-            "  c          Configuration page",
-            "  t          Cycle theme",
-            "  ?          Toggle this help",
-            "",
-            f"  Refresh every {self.REFRESH_INTERVAL}s",
-            "",
-            "Press any key to close",
-        ]
-        box_w = max(len(line) for line in help_lines) + 4
-        box_h = len(help_lines) + 2
+        rows = self._help_rows()
+        box_w = len(rows[0])
+        box_h = len(rows)
         start_y = max(0, (h - box_h) // 2)
         start_x = max(0, (w - box_w) // 2)
         attr = theme.get_attr(theme.HIGHLIGHT)
+        addnstr = self.stdscr.addnstr
         try:
-            self.stdscr.addnstr(start_y, start_x, "\u250c" + "\u2500" * (box_w - 2) + "\u2510", box_w, attr)
-            for i, line in enumerate(help_lines):
-                padded = f"\u2502 {line:<{box_w - 4}} \u2502"
-                self.stdscr.addnstr(start_y + 1 + i, start_x, padded, box_w, attr)
-            self.stdscr.addnstr(start_y + box_h - 1, start_x, "\u2514" + "\u2500" * (box_w - 2) + "\u2518", box_w, attr)
+            for i, row in enumerate(rows):
+                addnstr(start_y + i, start_x, row, box_w, attr)
         except curses.error:
             pass
 
@@ -270,8 +400,24 @@ class CICDashboard:
           [Agent Fleet]  [Server Health]
           [Cron Jobs]    [Security]
           [Activity Log] [SITREP]
+
+        The result depends only on the terminal size, so it is memoized
+        per (h, w) and recomputed on resize. Rectangles too small for a
+        panel to render are left out, so they are never drawn at all.
         """
-        h, w = self.stdscr.getmaxyx()
+        size = self.stdscr.getmaxyx()
+        if self._layout_cache is not None and self._layout_cache[0] == size:
+            return self._layout_cache[1]
+        layout = [
+            rect for rect in self._compute_layout(*size)
+            if rect[3] >= BasePanel.MIN_HEIGHT and rect[4] >= BasePanel.MIN_WIDTH
+        ]
+        self._layout_cache = (size, layout)
+        return layout
+
+    @staticmethod
+    def _compute_layout(h, w):
+        """Panel rectangles (idx, y, x, height, width) for an h x w screen."""
         content_y = 1
         content_h = h - 2
         if content_h < 6:
@@ -320,17 +466,39 @@ class CICDashboard:
             panel.focused = (idx == self.focused_panel)
             panel.draw(self.stdscr, y, x, height, width, c_normal, c_highlight, c_warn, c_error, c_dim)
 
-    def _do_background_refresh(self):
-        """Run data collection in a background thread using its own event loop."""
-        try:
+    def _background_loop(self):
+        """Event loop that runs data collection, started once on first use.
+
+        The loop lives on a daemon thread for the whole session, so each
+        refresh is just a coroutine submitted to it rather than a new loop
+        being created and torn down every cycle.
+        """
+        if self._bg_loop is None:
             loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._refresh_all_data())
-            loop.close()
-        except Exception:
-            pass  # Don't crash the UI thread on data errors
-        finally:
-            self._last_refresh_time = time.monotonic()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            self._bg_loop = loop
+        return self._bg_loop
+
+    def _is_refreshing(self):
+        return self._refresh_future is not None and not self._refresh_future.done()
+
+    def _on_refresh_done(self, future):
+        """Stamp the refresh time, backing off after failed refreshes.
+
+        Data problems must not crash the UI, so a failed refresh is logged
+        and the next one is pushed back by 5s per consecutive failure (up
+        to a minute) instead of being retried every interval.
+        """
+        now = time.monotonic()
+        error = None if future.cancelled() else future.exception()
+        if error is None:
+            self._consec_failures = 0
+            self._last_refresh_time = now
+            return
+        self._consec_failures += 1
+        log.error("refresh failed (%d in a row)", self._consec_failures,
+                  exc_info=error)
+        self._last_refresh_time = now + min(self._consec_failures * 5, 60)
 
     async def _refresh_all_data(self):
         """Refresh panel data using tiered collection.
@@ -342,59 +510,65 @@ class CICDashboard:
         now = time.monotonic()
         force_all = self._force_all_tiers
         self._force_all_tiers = False
-
-        def is_due(source, ttl):
-            if force_all:
-                return True
-            return (now - self._collection_timestamps.get(source, 0)) >= ttl
+        if force_all:
+            # Manual refresh must re-run commands, not replay memoized output
+            clear_command_cache()
+            self._backoff.clear()
+
+        # Pop everything whose deadline has passed; the heap keeps the
+        # earliest deadline on top, so a quiet tick stops at the first entry
+        if force_all:
+            due = {source for source, _, _ in self.COLLECTORS}
+            due.add("glacial_enrichment")
+            self._due_heap = []
+        else:
+            due = set()
+            while self._due_heap and self._due_heap[0][0] <= now:
+                due.add(heapq.heappop(self._due_heap)[1])
+        if "glacial_enrichment" in due:
+            heapq.heappush(self._due_heap, (now + self.TIER_GLACIAL, "glacial_enrichment"))
 
         # ── Build task list for due sources ──
         tasks = {}
-
-        # FAST tier (30s) — lightweight, changes often
-        if is_due("server_health", self.TIER_FAST):
-            tasks["server_health"] = get_server_health()
-        if is_due("top_processes", self.TIER_FAST):
-            tasks["top_processes"] = get_top_processes()
-
-        # MEDIUM tier (2 min) — moderate cost
-        if is_due("cron_jobs", self.TIER_MEDIUM):
-            tasks["cron_jobs"] = get_cron_jobs()
-        if is_due("activity_log", self.TIER_MEDIUM):
-            tasks["activity_log"] = get_activity_log()
-        if is_due("openclaw_logs", self.TIER_MEDIUM):
-            tasks["openclaw_logs"] = get_openclaw_logs(limit=20)
-        if is_due("error_summary", self.TIER_MEDIUM):
-            tasks["error_summary"] = get_error_summary()
-        if is_due("network_activity", self.TIER_MEDIUM):
-            tasks["network_activity"] = get_network_activity()
-
-        # SLOW tier (5 min) — expensive, rarely changes
-        if is_due("agents_data", self.TIER_SLOW):
-            tasks["agents_data"] = get_agents_data()
-        if is_due("openclaw_status", self.TIER_SLOW):
-            tasks["openclaw_status"] = get_openclaw_status()
-        nmap_in_slow = is_due("security_status", self.TIER_SLOW)
+        tiers = {}
+        for source, tier, collect in self.COLLECTORS:
+            if source in due:
+                tasks[source] = collect()
+                tiers[source] = getattr(self, tier)
+        nmap_in_slow = "security_status" in tasks
         if nmap_in_slow:
             self.nmap_scanning = True
-            tasks["security_status"] = get_security_status()
-        if is_due("ssh_login_summary", self.TIER_SLOW):
-            tasks["ssh_login_summary"] = get_ssh_login_summary()
-        if is_due("channels_status", self.TIER_SLOW):
-            tasks["channels_status"] = get_channels_status()
-        if is_due("update_status", self.TIER_SLOW):
-            tasks["update_status"] = get_update_status()
+
+        # The last-scan time only moves with the SLOW-tier security data, so
+        # it is re-read only then. It is a plain DB read, so it goes to an
+        # executor thread and overlaps the collectors.
+        last_scan_query = None
+        if nmap_in_slow or "last_nmap_time" not in self._cached_data:
+            last_scan_query = asyncio.get_running_loop().run_in_executor(
+                None, self._last_nmap_time,
+            )
 
         # ── Run all due tasks concurrently ──
+        failures = 0
         if tasks:
             keys = list(tasks.keys())
             results = await asyncio.gather(*tasks.values(), return_exceptions=True)
             for key, result in zip(keys, results):
-                if not isinstance(result, Exception):
+                factor = self._backoff.get(key, 1)
+                if isinstance(result, Exception):
+                    failures += 1
+                    factor = min(factor * 2, self.BACKOFF_ERROR_MAX)
+                elif result == self._cached_data.get(key):
+                    factor = min(factor * 2, self.BACKOFF_UNCHANGED_MAX)
+                else:
+                    factor = 1
                     self._cached_data[key] = result
-                self._collection_timestamps[key] = now
+                self._backoff[key] = factor
+                heapq.heappush(self._due_heap, (now + tiers[key] * factor, key))
             if nmap_in_slow:
                 self.nmap_scanning = False
+        if last_scan_query is not None:
+            self._cached_data["last_nmap_time"] = await last_scan_query
 
         # ── Read from cache (with safe defaults) ──
         def cached(key, default):
@@ -424,13 +598,19 @@ class CICDashboard:
             channels = []
         update_info = cached("update_status", {"available": False, "current": "", "latest": ""})
 
-        # Record metrics to DB
+        # Record metrics to DB in one transaction
         try:
-            self.recorder.record_agents(agents_data)
-            self.recorder.record_server(health)
-            self.recorder.record_cron(cron_data)
-            self.recorder.record_security(security_data)
-            self.recorder.record_network(network_data)
+            with self.db.batch():
+                self.recorder.record_agents(agents_data)
+                self.recorder.record_server(health)
+                self.recorder.record_cron(cron_data)
+                self.recorder.record_security(security_data)
+                self.recorder.record_network(network_data)
+                self.recorder.record_refresh_stats({
+                    "duration_ms": int((time.monotonic() - now) * 1000),
+                    "tasks_run": len(tasks),
+                    "failures": failures,
+                })
         except Exception:
             pass
 
@@ -447,15 +627,6 @@ class CICDashboard:
         self._mem_history.append(health.get("mem_percent", 0))
         self._disk_history.append(health.get("disk_percent", 0))
         self._net_history.append(network_data.get("active_connections", 0))
-        # Trim to max length
-        if len(self._cpu_history) > self._HISTORY_MAX:
-            self._cpu_history = self._cpu_history[-self._HISTORY_MAX:]
-        if len(self._mem_history) > self._HISTORY_MAX:
-            self._mem_history = self._mem_history[-self._HISTORY_MAX:]
-        if len(self._disk_history) > self._HISTORY_MAX:
-            self._disk_history = self._disk_history[-self._HISTORY_MAX:]
-        if len(self._net_history) > self._HISTORY_MAX:
-            self._net_history = self._net_history[-self._HISTORY_MAX:]
 
         cpu_history = list(self._cpu_history)
         mem_history = list(self._mem_history)
@@ -471,164 +642,261 @@ class CICDashboard:
         except Exception:
             cpu_avg = mem_avg = disk_avg = net_avg = None
 
-        # ── GLACIAL tier: DNS + geolocation + attacker scans ──
-        glacial_due = is_due("glacial_enrichment", self.TIER_GLACIAL)
-
-        if glacial_due:
-            geo_data = {}
-            attacker_scans = {}
-            try:
-                all_ips = set()
-                for entry_list in (ssh_summary.get("accepted", []), ssh_summary.get("failed", [])):
-                    for entry in entry_list:
-                        ip = entry.get("ip", "")
-                        if ip:
-                            entry["hostname"] = await resolve_ip(ip, db=self.db)
-                            all_ips.add(ip)
-                for ip in all_ips:
-                    geo_data[ip] = await get_ip_geolocation(ip, db=self.db)
-                self.nmap_scanning = True
-                for entry in ssh_summary.get("failed", [])[:3]:
-                    ip = entry.get("ip", "")
-                    if ip:
-                        attacker_scans[ip] = await scan_attacker_ip(ip, db=self.db)
-                self.nmap_scanning = False
-            except Exception:
-                self.nmap_scanning = False
-            self._cached_data["geo_data"] = geo_data
-            self._cached_data["attacker_scans"] = attacker_scans
-            self._collection_timestamps["glacial_enrichment"] = now
-        else:
-            geo_data = cached("geo_data", {})
-            attacker_scans = cached("attacker_scans", {})
-
         # Top IPs for server panel (uses resolve_ip with its own 24h DB cache)
         try:
             top_ips = await get_top_ips(network_data, db=self.db)
         except Exception:
             top_ips = []
 
+        view = {
+            "agents_data": agents_data,
+            "status_data": status_data,
+            "tokens_per_hour": tokens_per_hour,
+            "health": health,
+            "server_trends": server_trends,
+            "network_data": network_data,
+            "network_history": network_history,
+            "cpu_history": cpu_history,
+            "mem_history": mem_history,
+            "disk_history": disk_history,
+            "cpu_avg": cpu_avg,
+            "mem_avg": mem_avg,
+            "disk_avg": disk_avg,
+            "net_avg": net_avg,
+            "top_ips": top_ips,
+            "processes": processes,
+            "cron_data": cron_data,
+            "security_data": security_data,
+            "ssh_summary": _with_hostnames(ssh_summary, cached("host_map", {})),
+            "activity_events": activity_events,
+            "oc_logs": oc_logs,
+            "errors": errors,
+            "channels": channels,
+            "update_info": update_info,
+            "geo_data": cached("geo_data", {}),
+            "attacker_scans": cached("attacker_scans", {}),
+            "ext_ip_summary": cached("ext_ip_summary", []),
+            "last_nmap_time": cached("last_nmap_time", ""),
+        }
+
+        # ── GLACIAL tier: DNS + geolocation + attacker scans ──
+        if "glacial_enrichment" not in due:
+            self._update_panels(view)
+            return
+
+        ssh_entries = [
+            entry
+            for entry_list in (ssh_summary.get("accepted", []),
+                               ssh_summary.get("failed", []))
+            for entry in entry_list
+            if entry.get("ip", "")
+        ]
+        ip_set = frozenset(
+            {entry["ip"] for entry in ssh_entries}
+            | {ip for ip in network_data.get("peer_ips", {})
+               if ip and not ip.startswith("127.") and ip != "::1"}
+        )
+
+        # Same IPs as the last complete pass: its lookups are still good,
+        # and the view already carries its hostnames
+        last = self._last_glacial
+        if (not force_all and last is not None and last[0] == ip_set
+                and now - last[1] < self.GLACIAL_REUSE_MAX):
+            self._update_panels(view)
+            return
+
+        # Enrichment can take minutes (rate-limited geo lookups, nmap), so
+        # show the freshly collected data first instead of holding it back.
+        self._update_panels(view)
+
+        lookup_slots = asyncio.Semaphore(self.MAX_PARALLEL_LOOKUPS)
+        scan_slots = asyncio.Semaphore(self.MAX_PARALLEL_SCANS)
+
+        async def lookup(fn, ip):
+            async with lookup_slots:
+                return await fn(ip, db=self.db)
+
+        async def scan(ip):
+            async with scan_slots:
+                return await scan_attacker_ip(ip, db=self.db)
+
+        geo_data = {}
+        attacker_scans = {}
+        host_map = {}
+        complete = True
+        try:
+            all_ips = sorted({entry["ip"] for entry in ssh_entries})
+            hostnames = await asyncio.gather(
+                *(lookup(resolve_ip, ip) for ip in all_ips)
+            )
+            host_map = dict(zip(all_ips, hostnames))
+            geos = await asyncio.gather(
+                *(lookup(get_ip_geolocation, ip) for ip in all_ips)
+            )
+            geo_data = dict(zip(all_ips, geos))
+            self.nmap_scanning = True
+            scan_ips = [ip for ip in (entry.get("ip", "")
+                        for entry in ssh_summary.get("failed", [])[:3]) if ip]
+            scans = await asyncio.gather(*(scan(ip) for ip in scan_ips))
+            attacker_scans = dict(zip(scan_ips, scans))
+            self.nmap_scanning = False
+        except Exception:
+            self.nmap_scanning = False
+            complete = False
+        self._cached_data["geo_data"] = geo_data
+        self._cached_data["attacker_scans"] = attacker_scans
+
         # Build external IP summary for activity panel
-        ext_ip_summary = cached("ext_ip_summary", [])
-        if glacial_due:
-            try:
-                all_external = set()
-                # From network connections
-                for ip in network_data.get("peer_ips", {}):
-                    if ip and not ip.startswith("127.") and ip != "::1":
-                        all_external.add(ip)
-                # From SSH logs
-                for entry_list in (ssh_summary.get("accepted", []),
-                                   ssh_summary.get("failed", [])):
-                    for entry in entry_list:
-                        ip = entry.get("ip", "")
-                        if ip:
-                            all_external.add(ip)
-
-                summary = []
-                for ip in sorted(all_external):
-                    hostname = await resolve_ip(ip, db=self.db)
-                    geo = geo_data.get(ip) or await get_ip_geolocation(ip, db=self.db)
-                    scan = attacker_scans.get(ip) or await scan_attacker_ip(ip, db=self.db)
-                    summary.append({
-                        "ip": ip,
-                        "hostname": hostname,
-                        "country": geo.get("country_code", "?"),
-                        "ports": scan.get("open_ports", ""),
-                    })
-                ext_ip_summary = summary
-                self._cached_data["ext_ip_summary"] = ext_ip_summary
-            except Exception:
-                pass
+        ext_ip_summary = view["ext_ip_summary"]
+        try:
+            # IPs already handled by the SSH enrichment above reuse its
+            # results; only peers seen on the network are looked up here
+            async def summarize(ip):
+                hostname = host_map.get(ip) or await lookup(resolve_ip, ip)
+                geo = geo_data.get(ip) or await lookup(get_ip_geolocation, ip)
+                result = attacker_scans.get(ip) or await scan(ip)
+                return {
+                    "ip": ip,
+                    "hostname": hostname,
+                    "country": geo.get("country_code", "?"),
+                    "ports": result.get("open_ports", ""),
+                }
+
+            ext_ip_summary = list(await asyncio.gather(
+                *(summarize(ip) for ip in sorted(ip_set))
+            ))
+            self._cached_data["ext_ip_summary"] = ext_ip_summary
+        except Exception:
+            complete = False
 
-        # Update panels (thread-safe since Python GIL protects attribute assignment)
-        with self._refresh_lock:
-            self.panels[0].update(agents_data, status_data, tokens_per_hour)
-            self.panels[1].update(
-                health, server_trends,
-                network_history=network_history,
-                network_current=network_data.get("active_connections", 0),
-                top_ips=top_ips,
-                cpu_history=cpu_history,
-                mem_history=mem_history,
-                disk_history=disk_history,
-                cpu_avg=cpu_avg,
-                mem_avg=mem_avg,
-                disk_avg=disk_avg,
-                net_avg=net_avg,
-                processes=processes,
+        self._cached_data["host_map"] = host_map
+        self._last_glacial = (ip_set, now) if complete else None
+
+        # A new view: the one published above belongs to the UI thread now
+        self._update_panels(dict(
+            view, ssh_summary=_with_hostnames(ssh_summary, host_map),
+            geo_data=geo_data, attacker_scans=attacker_scans,
+            ext_ip_summary=ext_ip_summary,
+        ))
+
+    def _last_nmap_time(self):
+        """HH:MM:SS of the newest port scan, or "" (runs on an executor)."""
+        try:
+            row = self.db.fetchone(
+                "SELECT timestamp FROM port_scans ORDER BY timestamp DESC LIMIT 1"
             )
-            self.panels[2].update(cron_data)
+        except Exception:
+            return ""
+        if not row:
+            return ""
+        return datetime.fromtimestamp(row["timestamp"]).strftime("%H:%M:%S")
+
+    def _update_panels(self, view):
+        """Publish one refresh's worth of collected data for the panels."""
+        health = view["health"]
+        network_data = view["network_data"]
+        ssh_summary = view["ssh_summary"]
+        attacker_scans = view["attacker_scans"]
+        geo_data = view["geo_data"]
+        cron_data = view["cron_data"]
+        security_data = view["security_data"]
+        activity_events = view["activity_events"]
+        oc_logs = view["oc_logs"]
+        channels = view["channels"]
+        update_info = view["update_info"]
+
+        # Derive everything the panels need here on the refresh thread, so
+        # the UI thread never waits on the event sorting below.
+        # Build ECM scan list from top 5 failed SSH IPs
+        ecm_scans = []
+        failed_ips = ssh_summary.get("failed", []) if isinstance(ssh_summary, dict) else []
+        for entry in failed_ips[:5]:
+            ip = entry.get("ip", "")
+            if not ip:
+                continue
+            scan = attacker_scans.get(ip, {})
+            geo = geo_data.get(ip, {})
+            cc = geo.get("country_code", "?") if geo else "?"
+            city = geo.get("city", "") if geo else ""
+
+            if scan:
+                ecm_scans.append({
+                    "ip": ip,
+                    "cc": cc,
+                    "city": city,
+                    "status": "complete",
+                    "ports": scan.get("open_ports", ""),
+                    "os_guess": scan.get("os_guess", ""),
+                })
+            elif self.nmap_scanning:
+                ecm_scans.append({
+                    "ip": ip, "cc": cc, "city": city,
+                    "status": "scanning", "ports": "", "os_guess": "",
+                })
+            else:
+                ecm_scans.append({
+                    "ip": ip, "cc": cc, "city": city,
+                    "status": "pending", "ports": "", "os_guess": "",
+                })
+
+        # Both were normalized to lists when the view was built
+        all_events = activity_events + oc_logs
+        all_events.sort(key=itemgetter("_ts"), reverse=True)
+
+        # SITREP panel — channels, update, action items
+        action_items = build_action_items(
+            cron_data, security_data, channels, update_info, health,
+        )
 
-            last_scan = None
-            try:
-                last_scan = self.db.fetchone(
-                    "SELECT timestamp FROM port_scans ORDER BY timestamp DESC LIMIT 1"
-                )
-            except Exception:
-                pass
-            last_nmap_time = ""
-            if last_scan:
-                last_nmap_time = datetime.fromtimestamp(
-                    last_scan["timestamp"]
-                ).strftime("%H:%M:%S")
-
-            # Build ECM scan list from top 5 failed SSH IPs
-            ecm_scans = []
-            failed_ips = ssh_summary.get("failed", []) if isinstance(ssh_summary, dict) else []
-            for entry in failed_ips[:5]:
-                ip = entry.get("ip", "")
-                if not ip:
-                    continue
-                scan = attacker_scans.get(ip, {})
-                geo = geo_data.get(ip, {})
-                cc = geo.get("country_code", "?") if geo else "?"
-                city = geo.get("city", "") if geo else ""
-
-                if scan:
-                    ecm_scans.append({
-                        "ip": ip,
-                        "cc": cc,
-                        "city": city,
-                        "status": "complete",
-                        "ports": scan.get("open_ports", ""),
-                        "os_guess": scan.get("os_guess", ""),
-                    })
-                elif self.nmap_scanning:
-                    ecm_scans.append({
-                        "ip": ip, "cc": cc, "city": city,
-                        "status": "scanning", "ports": "", "os_guess": "",
-                    })
-                else:
-                    ecm_scans.append({
-                        "ip": ip, "cc": cc, "city": city,
-                        "status": "pending", "ports": "", "os_guess": "",
-                    })
-
-            self.panels[3].update(
-                security_data, ssh_summary=ssh_summary,
-                last_nmap_time=last_nmap_time,
+        # (args, kwargs) for each panel's update(), in panel order
+        updates = (
+            ((view["agents_data"], view["status_data"],
+              view["tokens_per_hour"]), {}),
+            ((health, view["server_trends"]), dict(
+                network_history=view["network_history"],
+                network_current=network_data.get("active_connections", 0),
+                top_ips=view["top_ips"],
+                cpu_history=view["cpu_history"],
+                mem_history=view["mem_history"],
+                disk_history=view["disk_history"],
+                cpu_avg=view["cpu_avg"],
+                mem_avg=view["mem_avg"],
+                disk_avg=view["disk_avg"],
+                net_avg=view["net_avg"],
+                processes=view["processes"],
+            )),
+            ((cron_data,), {}),
+            ((security_data,), dict(
+                ssh_summary=ssh_summary,
+                last_nmap_time=view["last_nmap_time"],
                 attacker_scans=attacker_scans,
                 geo_data=geo_data,
                 nmap_scanning=self.nmap_scanning,
                 ecm_scans=ecm_scans,
-            )
-
-            all_events = (activity_events if isinstance(activity_events, list) else []) + \
-                         (oc_logs if isinstance(oc_logs, list) else [])
-            all_events.sort(key=lambda e: e.get("time", ""), reverse=True)
-            self.panels[4].update(all_events, errors=errors,
-                                  ext_ip_summary=ext_ip_summary)
-
-            # SITREP panel — channels, update, action items
-            action_items = build_action_items(
-                cron_data, security_data, channels, update_info, health,
-            )
-            self.panels[5].update(
+            )),
+            ((all_events,), dict(errors=view["errors"],
+                                 ext_ip_summary=view["ext_ip_summary"])),
+            ((), dict(
                 channels=channels,
                 update_info=update_info,
                 action_items=action_items,
-            )
+            )),
+        )
+        # A single reference assignment hands the batch to the UI thread
+        self._published = (self._published[0] + 1, updates)
+
+    def _apply_published(self):
+        """Apply the newest published panel data (UI thread only).
+
+        Panels are only ever mutated here, between frames, so drawing needs
+        no lock and a refresh can never stall a redraw.
+        """
+        gen, updates = self._published
+        if gen == self._data_gen:
+            return
+        for panel, (args, kwargs) in zip(self.panels, updates):
+            panel.update(*args, **kwargs)
+        self._data_gen = gen
 
     def _draw_detail_view(self):
         """Draw a full-screen detail view for a panel or config."""
@@ -806,20 +1074,17 @@ class CICDashboard:
     def _maybe_start_refresh(self):
         """Start background refresh if interval elapsed or forced."""
         now = time.monotonic()
-        thread_alive = self._refresh_thread is not None and self._refresh_thread.is_alive()
-
-        if thread_alive:
+        if self._is_refreshing():
             return  # Already refreshing
 
         should_refresh = self._force_refresh or (now - self._last_refresh_time) >= self.REFRESH_INTERVAL
 
         if should_refresh:
             self._force_refresh = False
-            self._refresh_thread = threading.Thread(
-                target=self._do_background_refresh,
-                daemon=True,
+            self._refresh_future = asyncio.run_coroutine_threadsafe(
+                self._refresh_all_data(), self._background_loop(),
             )
-            self._refresh_thread.start()
+            self._refresh_future.add_done_callback(self._on_refresh_done)
 
     def _get_reading_order(self):
         """Get panel indices in visual reading order (left-to-right, top-to-bottom)."""
@@ -848,44 +1113,98 @@ class CICDashboard:
                 self._detail_view = None
             return True
 
-        if key == ord("q"):
-            return False
-        elif key == ord("r"):
-            self._force_refresh = True
-            self._force_all_tiers = True
-        elif key in (ord("1"), ord("2"), ord("3"), ord("4"), ord("5"), ord("6")):
-            self.focused_panel = key - ord("1")
-        elif key == ord("\t"):
-            # Cycle in visual reading order
-            order = self._get_reading_order()
-            try:
-                idx = order.index(self.focused_panel)
-                self.focused_panel = order[(idx + 1) % len(order)]
-            except ValueError:
-                self.focused_panel = order[0] if order else 0
-        elif key == curses.KEY_BTAB:  # Shift+Tab — reverse cycle
-            order = self._get_reading_order()
-            try:
-                idx = order.index(self.focused_panel)
-                self.focused_panel = order[(idx - 1) % len(order)]
-            except ValueError:
-                self.focused_panel = order[-1] if order else 0
-        elif key in (ord("\n"), curses.KEY_ENTER, 10, 13):
-            # Enter opens detail view for focused panel
-            self._detail_view = self.focused_panel
-        elif key == ord("c"):
-            # Config page
-            self._detail_view = "config"
-        elif key == ord("t"):
-            theme.cycle_theme()
-            self._init_colors()
-        elif key == ord("?"):
-            self.show_help_overlay = not self.show_help_overlay
-        elif key == 27:
+        handler = self._key_actions.get(key)
+        if handler is None:
+            # Any other key just dismisses the help overlay
             self.show_help_overlay = False
-        elif self.show_help_overlay:
-            self.show_help_overlay = False
-        return True
+            return True
+        return handler() is not False
+
+    def _build_key_actions(self):
+        """Dashboard key -> handler table; a handler returning False quits."""
+        actions = {
+            ord("q"): lambda: False,
+            ord("r"): self._act_refresh,
+            ord("\t"): lambda: self._act_cycle(1),
+            curses.KEY_BTAB: lambda: self._act_cycle(-1),  # Shift+Tab
+            ord("c"): self._act_config,
+            ord("t"): self._act_theme,
+            ord("?"): self._act_toggle_help,
+            27: self._act_close_help,
+        }
+        for key in (ord("\n"), curses.KEY_ENTER, 13):
+            actions[key] = self._act_detail
+        for idx in range(6):
+            actions[ord("1") + idx] = lambda idx=idx: self._act_focus(idx)
+        return actions
+
+    def _act_refresh(self):
+        self._force_refresh = True
+        self._force_all_tiers = True
+
+    def _act_focus(self, idx):
+        self.focused_panel = idx
+
+    def _act_cycle(self, step):
+        """Move focus in visual reading order (step=-1 reverses)."""
+        order = self._get_reading_order()
+        try:
+            idx = order.index(self.focused_panel)
+            self.focused_panel = order[(idx + step) % len(order)]
+        except ValueError:
+            if order:
+                self.focused_panel = order[0] if step > 0 else order[-1]
+            else:
+                self.focused_panel = 0
+
+    def _act_detail(self):
+        # Enter opens detail view for focused panel
+        self._detail_view = self.focused_panel
+
+    def _act_config(self):
+        self._detail_view = "config"
+
+    def _act_theme(self):
+        theme.cycle_theme()
+        self._init_colors()
+
+    def _act_toggle_help(self):
+        self.show_help_overlay = not self.show_help_overlay
+
+    def _act_close_help(self):
+        self.show_help_overlay = False
+
+    def _frame_key(self):
+        """Everything a frame shows that can change without a key press.
+
+        The main loop skips the redraw while this is unchanged, so an idle
+        dashboard repaints about once a second (clock tick) instead of at
+        the 10fps input poll rate.
+        """
+        security = self.panels[3]
+        is_refreshing = self._is_refreshing()
+        return (
+            self._clock_strings(),
+            self._seconds_until_refresh(),
+            is_refreshing,
+            self._data_gen,
+            self.nmap_scanning,
+            security.ecm_scan_running,
+            id(security.ecm_scan_output),
+            len(security.ecm_scan_output),
+        )
+
+    def _poll_timeout_ms(self):
+        """How long getch may block before the loop needs to run again.
+
+        While a refresh or ECM scan is streaming in, poll at ~10fps. When
+        idle, sleep until the next clock second: key presses still wake
+        getch at once, and nothing else on screen changes before then.
+        """
+        is_refreshing = self._is_refreshing()
+        if is_refreshing or self.panels[3].ecm_scan_running:
+            return 100
+        return max(10, int((1.0 - time.time() % 1.0) * 1000))
 
     def _main_loop(self, stdscr):
         """Main UI loop — redraws at ~10fps, data refreshes in background."""
@@ -894,7 +1213,7 @@ class CICDashboard:
 
         curses.curs_set(0)
         stdscr.nodelay(True)
-        stdscr.timeout(100)  # 100ms = ~10fps for smooth clock
+        stdscr.timeout(100)  # adjusted each pass by _poll_timeout_ms
 
         self._init_colors()
 
@@ -902,9 +1221,11 @@ class CICDashboard:
         bg = theme.get_attr(theme.NORMAL)
         stdscr.bkgd(' ', bg)
         stdscr.clear()
+        last_frame = None
 
         while self.running:
             # Handle input
+            stdscr.timeout(self._poll_timeout_ms())
             try:
                 key = stdscr.getch()
             except curses.error:
@@ -916,17 +1237,21 @@ class CICDashboard:
 
             # Start background data refresh if needed
             self._maybe_start_refresh()
+            self._apply_published()
+
+            # Redraw only on input or when something on screen changed
+            frame = self._frame_key()
+            if key == -1 and frame == last_frame:
+                continue
+            last_frame = frame
 
-            # Redraw UI (always — clock updates every frame)
             stdscr.erase()
             self._draw_header()
 
             if self._detail_view is not None:
-                with self._refresh_lock:
-                    self._draw_detail_view()
+                self._draw_detail_view()
             else:
-                with self._refresh_lock:
-                    self._draw_panels()
+                self._draw_panels()
 
             self._draw_footer()
 
@@ -934,12 +1259,16 @@ class CICDashboard:
                 self._draw_help_overlay()
 
             stdscr.refresh()
-            # Sleep briefly for ~10fps (100ms timeout on getch handles this)
+            # getch() blocks for the pacing interval (see _poll_timeout_ms)
 
     def run(self):
         """Start the curses application."""
         locale.setlocale(locale.LC_ALL, "")
-        curses.wrapper(self._main_loop)
+        try:
+            curses.wrapper(self._main_loop)
+        finally:
+            if self._bg_loop is not None:
+                self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
 
 
 def main():
@@ -18,6 +18,7 @@ Commands:
 import argparse
 import json
 import os
+import shutil
 import subprocess
 import sys
 import time
@@ -39,15 +40,29 @@ def _is_running():
     return out == "active"
 
 
+def _stays_running(settle=1.0, step=0.2):
+    """Watch a just-started collector for an early crash.
+
+    systemctl returns as soon as the process is exec'd, before imports or
+    the DB open can fail, so the unit is polled for a short settle window
+    and reported dead as soon as it leaves the active state.
+    """
+    deadline = time.monotonic() + settle
+    while _is_running():
+        if time.monotonic() >= deadline:
+            return True
+        time.sleep(step)
+    return False
+
+
 def cmd_start(args):
     """Start the collector daemon."""
     if _is_running():
         print("Collector is already running")
         cmd_status(args)
         return
-    _systemctl("start", SERVICE_NAME)
-    time.sleep(1)
-    if _is_running():
+    _, rc = _systemctl("start", SERVICE_NAME)
+    if rc == 0 and _stays_running():
         print("✓ Collector started")
     else:
         print("✖ Failed to start collector")
@@ -60,9 +75,8 @@ def cmd_stop(args):
     if not _is_running():
         print("Collector is not running")
         return
-    _systemctl("stop", SERVICE_NAME)
-    time.sleep(1)
-    if not _is_running():
+    _, rc = _systemctl("stop", SERVICE_NAME)
+    if rc == 0 and not _is_running():
         print("✓ Collector stopped")
     else:
         print("✖ Failed to stop collector")
@@ -70,9 +84,8 @@ def cmd_stop(args):
 
 def cmd_restart(args):
     """Restart the collector daemon."""
-    _systemctl("restart", SERVICE_NAME)
-    time.sleep(1)
-    if _is_running():
+    _, rc = _systemctl("restart", SERVICE_NAME)
+    if rc == 0 and _stays_running():
         print("✓ Collector restarted")
     else:
         print("✖ Failed to restart collector")
@@ -86,16 +99,14 @@ def cmd_status(args):
     if _is_running():
         out, _ = _systemctl("show", SERVICE_NAME,
                             "--property=MainPID,ActiveEnterTimestamp,MemoryCurrent")
-        props = {}
-        for line in out.splitlines():
-            if "=" in line:
-                k, v = line.split("=", 1)
-                props[k] = v
+        # Keyed rather than --value: systemctl prints properties in its own
+        # order, not the order they were requested in
+        props = dict(line.split("=", 1) for line in out.splitlines() if "=" in line)
         pid = props.get("MainPID", "?")
         since = props.get("ActiveEnterTimestamp", "?")
         mem = props.get("MemoryCurrent", "?")
         if mem.isdigit():
-            mem = f"{int(mem) / 1024 / 1024:.1f}MB"
+            mem = f"{int(mem) / 1048576:.1f}MB"
         print(f"  Collector:  ● RUNNING (PID {pid})")
         print(f"  Since:      {since}")
         print(f"  Memory:     {mem}")
@@ -128,12 +139,8 @@ def cmd_collect(args):
     print("Running single collection cycle...")
     daemon = CollectorDaemon()
 
-    async def once():
-        # Force all tiers
-        daemon._timestamps.clear()
-        await daemon.collect_once()
-
-    asyncio.run(once())
+    # A fresh daemon has every tier due, so one pass collects everything
+    asyncio.run(daemon.collect_once())
     print("✓ Collection complete")
     _print_db_stats()
 
@@ -152,49 +159,64 @@ def cmd_db(args):
         _print_db_stats()
 
 
+# (table, label, timestamp column or None) for the `gcic db` summary
+_STATS_TABLES = (
+    ("server_metrics", "Server", "timestamp"),
+    ("agent_metrics", "Agents", "timestamp"),
+    ("cron_metrics", "Cron", "timestamp"),
+    ("security_metrics", "Security", "timestamp"),
+    ("network_metrics", "Network", "timestamp"),
+    ("dns_cache", "DNS cache", None),
+    ("attacker_scans", "Attacker scans", None),
+    ("geo_cache", "Geolocation", None),
+    ("sitrep_cache", "SITREP", "timestamp"),
+    ("refresh_stats", "Refresh stats", "timestamp"),
+)
+
+
+def _stats_sql(present):
+    """One UNION ALL query returning (table, count, newest) per table."""
+    return " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*), {f'MAX({ts})' if ts else 'NULL'} FROM {table}"
+        for table, _, ts in _STATS_TABLES if table in present
+    )
+
+
 def _print_db_stats():
     """Print database statistics."""
-    if not os.path.exists(DB_PATH):
+    try:
+        st = os.stat(DB_PATH)
+    except FileNotFoundError:
         print("  Database:   not found")
         return
 
     import sqlite3
-    size_mb = os.path.getsize(DB_PATH) / 1024 / 1024
+    from datetime import datetime
+    size_mb = st.st_size / 1024 / 1024
     print(f"  Database:   {DB_PATH} ({size_mb:.1f}MB)")
 
     try:
-        conn = sqlite3.connect(DB_PATH)
-        tables = {
-            "server_metrics": "Server",
-            "agent_metrics": "Agents",
-            "cron_metrics": "Cron",
-            "security_metrics": "Security",
-            "network_metrics": "Network",
-            "dns_cache": "DNS cache",
-            "attacker_scans": "Attacker scans",
-            "geo_cache": "Geolocation",
-            "sitrep_cache": "SITREP",
-        }
-        for table, label in tables.items():
-            try:
-                row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
-                count = row[0] if row else 0
-                # Get newest timestamp if available
-                try:
-                    ts_row = conn.execute(
-                        f"SELECT MAX(timestamp) FROM {table}"
-                    ).fetchone()
-                    if ts_row and ts_row[0]:
-                        from datetime import datetime
-                        newest = datetime.fromtimestamp(ts_row[0]).strftime("%H:%M:%S")
-                        print(f"  {label + ':':<18} {count:>6} records  (latest: {newest})")
-                    else:
-                        print(f"  {label + ':':<18} {count:>6} records")
-                except Exception:
-                    print(f"  {label + ':':<18} {count:>6} records")
-            except Exception:
-                pass
-        conn.close()
+        # Read-only, so a status check never takes a write lock from the daemon
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+        try:
+            # Older databases may predate some tables
+            present = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )}
+            sql = _stats_sql(present)
+            rows = {table: (count, newest) for table, count, newest
+                    in conn.execute(sql)} if sql else {}
+        finally:
+            conn.close()
+        for table, label, _ in _STATS_TABLES:
+            if table not in rows:
+                continue
+            count, newest = rows[table]
+            if newest:
+                newest = datetime.fromtimestamp(newest).strftime("%H:%M:%S")
+                print(f"  {label + ':':<18} {count:>6} records  (latest: {newest})")
+            else:
+                print(f"  {label + ':':<18} {count:>6} records")
     except Exception as e:
         print(f"  Error reading DB: {e}")
 
@@ -216,10 +238,7 @@ def cmd_install(args):
     os.makedirs(service_dir, exist_ok=True)
 
     # Find the collector binary
-    collector_bin = subprocess.run(
-        ["which", "galactic-cic-collector"],
-        capture_output=True, text=True
-    ).stdout.strip()
+    collector_bin = shutil.which("galactic-cic-collector") or ""
 
     if not collector_bin:
         print("✖ galactic-cic-collector not found in PATH")
@@ -236,7 +255,7 @@ Description=GalacticCIC Data Collector
 After=default.target
 
 [Service]
-Type=simple
+Type=exec
 Environment=PATH={path_dirs}
 ExecStart={collector_bin} --interval 30
 Restart=on-failure
@@ -10,10 +10,14 @@ Usage:
 """
 
 import asyncio
+import atexit
+import heapq
+import queue
 import signal
 import sys
 import time
 import logging
+import logging.handlers
 from datetime import datetime, timezone
 
 from galactic_cic.data.collectors import (
@@ -46,12 +50,49 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+
+def _buffer_logging():
+    """Move the root handlers behind a queue drained by a listener thread.
+
+    Under systemd stdout is a pipe to journald; if journald stalls, a
+    direct write would block the collection loop. Records are queued
+    instead and written by the listener, which is flushed at exit.
+    """
+    root = logging.getLogger()
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        records, *root.handlers, respect_handler_level=True,
+    )
+    root.handlers = [logging.handlers.QueueHandler(records)]
+    listener.start()
+    atexit.register(listener.stop)
+
 # Tiered intervals (seconds)
 TIER_FAST = 30       # server health, top processes
 TIER_MEDIUM = 120    # cron, activity, logs, network
 TIER_SLOW = 300      # agents, openclaw status, security, channels, update
 TIER_GLACIAL = 900   # attacker scans, geolocation, DNS resolution
 
+# Concurrent nmap processes during a glacial pass
+MAX_PARALLEL_SCANS = 2
+
+# (source, tier TTL, collector) for each tiered source
+COLLECTORS = (
+    ("server_health", TIER_FAST, get_server_health),
+    ("top_processes", TIER_FAST, get_top_processes),
+    ("cron_jobs", TIER_MEDIUM, get_cron_jobs),
+    ("activity_log", TIER_MEDIUM, get_activity_log),
+    ("openclaw_logs", TIER_MEDIUM, lambda: get_openclaw_logs(limit=20)),
+    ("error_summary", TIER_MEDIUM, get_error_summary),
+    ("network_activity", TIER_MEDIUM, get_network_activity),
+    ("agents_data", TIER_SLOW, get_agents_data),
+    ("openclaw_status", TIER_SLOW, get_openclaw_status),
+    ("security_status", TIER_SLOW, get_security_status),
+    ("ssh_login_summary", TIER_SLOW, get_ssh_login_summary),
+    ("channels_status", TIER_SLOW, get_channels_status),
+    ("update_status", TIER_SLOW, get_update_status),
+)
+
 
 class CollectorDaemon:
     """Background data collector with tiered refresh."""
@@ -61,53 +102,32 @@ class CollectorDaemon:
         self.running = True
         self.db = MetricsDB()
         self.recorder = MetricsRecorder(self.db)
-        self._timestamps = {}  # source -> monotonic time
+        # Nothing is polled more often than the fast-tier interval
+        self._ttls = {source: max(ttl, fast_interval) for source, ttl, _ in COLLECTORS}
+        # (next due monotonic time, source); everything is due at start
+        self._due_heap = [(0.0, source) for source, _, _ in COLLECTORS]
+        self._due_heap.append((0.0, "glacial_enrichment"))
+        heapq.heapify(self._due_heap)
+        self._wakeup = None  # asyncio.Event set by stop() while run() sleeps
         self._cached_data = {}  # source -> last result
 
-    def _is_due(self, source, ttl):
-        now = time.monotonic()
-        return (now - self._timestamps.get(source, 0)) >= ttl
-
-    def _mark(self, source):
-        self._timestamps[source] = time.monotonic()
+    def _pop_due(self, now):
+        """Pop and return every source whose deadline has passed."""
+        due = set()
+        while self._due_heap and self._due_heap[0][0] <= now:
+            due.add(heapq.heappop(self._due_heap)[1])
+        return due
 
     async def collect_once(self):
         """Run one collection cycle with tiered scheduling."""
-        tasks = {}
-
-        # FAST tier
-        if self._is_due("server_health", TIER_FAST):
-            tasks["server_health"] = get_server_health()
-        if self._is_due("top_processes", TIER_FAST):
-            tasks["top_processes"] = get_top_processes()
-
-        # MEDIUM tier
-        if self._is_due("cron_jobs", TIER_MEDIUM):
-            tasks["cron_jobs"] = get_cron_jobs()
-        if self._is_due("activity_log", TIER_MEDIUM):
-            tasks["activity_log"] = get_activity_log()
-        if self._is_due("openclaw_logs", TIER_MEDIUM):
-            tasks["openclaw_logs"] = get_openclaw_logs(limit=20)
-        if self._is_due("error_summary", TIER_MEDIUM):
-            tasks["error_summary"] = get_error_summary()
-        if self._is_due("network_activity", TIER_MEDIUM):
-            tasks["network_activity"] = get_network_activity()
-
-        # SLOW tier
-        if self._is_due("agents_data", TIER_SLOW):
-            tasks["agents_data"] = get_agents_data()
-        if self._is_due("openclaw_status", TIER_SLOW):
-            tasks["openclaw_status"] = get_openclaw_status()
-        if self._is_due("security_status", TIER_SLOW):
-            tasks["security_status"] = get_security_status()
-        if self._is_due("ssh_login_summary", TIER_SLOW):
-            tasks["ssh_login_summary"] = get_ssh_login_summary()
-        if self._is_due("channels_status", TIER_SLOW):
-            tasks["channels_status"] = get_channels_status()
-        if self._is_due("update_status", TIER_SLOW):
-            tasks["update_status"] = get_update_status()
+        started = time.monotonic()
+        due = self._pop_due(started)
+        tasks = {source: collect() for source, _, collect in COLLECTORS
+                 if source in due}
 
         if not tasks:
+            if "glacial_enrichment" in due:
+                await self._run_glacial({})
             return
 
         # Run all due tasks concurrently
@@ -115,59 +135,76 @@ class CollectorDaemon:
         results = await asyncio.gather(*tasks.values(), return_exceptions=True)
 
         collected = {}
+        done = time.monotonic()
         for key, result in zip(keys, results):
             if isinstance(result, Exception):
                 log.warning("Failed to collect %s: %s", key, result)
+                # Retry on the next fast-tier tick
+                heapq.heappush(self._due_heap, (done + self.fast_interval, key))
             else:
                 collected[key] = result
                 self._cached_data[key] = result
-                self._mark(key)
+                heapq.heappush(self._due_heap, (done + self._ttls[key], key))
 
-        # Record to database
+        # Record metrics and SITREP data in one transaction
+        rec = self.recorder
+        cached = self._cached_data.get
         try:
-            if "agents_data" in collected:
-                self.recorder.record_agents(collected["agents_data"])
-            if "server_health" in collected:
-                self.recorder.record_server(collected["server_health"])
-            if "cron_jobs" in collected:
-                self.recorder.record_cron(collected["cron_jobs"])
-            if "security_status" in collected:
-                self.recorder.record_security(collected["security_status"])
-            if "network_activity" in collected:
-                self.recorder.record_network(collected["network_activity"])
+            with self.db.batch():
+                try:
+                    if "agents_data" in collected:
+                        rec.record_agents(collected["agents_data"])
+                    if "server_health" in collected:
+                        rec.record_server(collected["server_health"])
+                    if "cron_jobs" in collected:
+                        rec.record_cron(collected["cron_jobs"])
+                    if "security_status" in collected:
+                        rec.record_security(collected["security_status"])
+                    if "network_activity" in collected:
+                        rec.record_network(collected["network_activity"])
+                    rec.record_refresh_stats({
+                        "duration_ms": int((time.monotonic() - started) * 1000),
+                        "tasks_run": len(keys),
+                        "failures": len(keys) - len(collected),
+                    })
+                except Exception as e:
+                    log.warning("Failed to record metrics: %s", e)
+
+                # Record SITREP data (channels, update, action items); fresh
+                # results are already in the cache, so it covers both
+                try:
+                    channels = cached("channels_status", [])
+                    update_info = cached("update_status", {})
+                    cron_data = cached("cron_jobs", {"jobs": []})
+                    security_data = cached("security_status", {})
+                    health = cached("server_health", {})
+                    action_items = build_action_items(
+                        cron_data, security_data, channels, update_info, health,
+                    )
+                    rec.record_sitrep(
+                        channels=channels,
+                        update_info=update_info,
+                        action_items=action_items,
+                    )
+                except Exception as e:
+                    log.warning("Failed to record SITREP: %s", e)
         except Exception as e:
-            log.warning("Failed to record metrics: %s", e)
+            log.warning("Failed to commit collected data: %s", e)
 
-        # Record SITREP data (channels, update, action items)
-        try:
-            channels = collected.get("channels_status",
-                                     self._cached_data.get("channels_status", []))
-            update_info = collected.get("update_status",
-                                        self._cached_data.get("update_status", {}))
-            cron_data = collected.get("cron_jobs",
-                                      self._cached_data.get("cron_jobs", {"jobs": []}))
-            security_data = collected.get("security_status",
-                                          self._cached_data.get("security_status", {}))
-            health = collected.get("server_health",
-                                    self._cached_data.get("server_health", {}))
-            action_items = build_action_items(
-                cron_data, security_data, channels, update_info, health,
-            )
-            self.recorder.record_sitrep(
-                channels=channels,
-                update_info=update_info,
-                action_items=action_items,
-            )
-        except Exception as e:
-            log.warning("Failed to record SITREP: %s", e)
-
-        sources = ", ".join(collected.keys())
-        log.info("Collected: %s", sources)
+        if log.isEnabledFor(logging.INFO):
+            log.info("Collected: %s", ", ".join(collected))
 
         # ── GLACIAL tier: scan top failed SSH IPs ──
-        if self._is_due("glacial_enrichment", TIER_GLACIAL):
+        if "glacial_enrichment" in due:
+            await self._run_glacial(collected)
+
+    async def _run_glacial(self, collected):
+        # Rescheduled even if enrichment raises, or it would never run again
+        try:
             await self._glacial_enrichment(collected)
-            self._mark("glacial_enrichment")
+        finally:
+            heapq.heappush(self._due_heap, (time.monotonic() + TIER_GLACIAL,
+                                            "glacial_enrichment"))
 
     async def _glacial_enrichment(self, collected):
         """DNS resolution, geolocation, and nmap scans for top failed SSH IPs."""
@@ -181,27 +218,33 @@ class CollectorDaemon:
         if not failed:
             return
 
-        log.info("Glacial: scanning top %d failed SSH IPs", min(len(failed), 5))
+        entries = [entry for entry in failed[:5] if entry.get("ip", "")]
+        log.info("Glacial: scanning top %d failed SSH IPs", len(entries))
+        scan_slots = asyncio.Semaphore(MAX_PARALLEL_SCANS)
+
+        async def enrich(entry):
+            ip = entry["ip"]
+            # DNS resolution and geolocation (both use the DB cache)
+            hostname, _ = await asyncio.gather(
+                resolve_ip(ip, db=self.db),
+                get_ip_geolocation(ip, db=self.db),
+            )
+            entry["hostname"] = hostname
+            # Nmap scan of attacker (uses DB cache)
+            async with scan_slots:
+                return await scan_attacker_ip(ip, db=self.db)
+
+        # All IPs are enriched concurrently; only the nmap scans are capped
+        results = await asyncio.gather(*(enrich(e) for e in entries),
+                                       return_exceptions=True)
         scanned = 0
-        for entry in failed[:5]:
-            ip = entry.get("ip", "")
-            if not ip:
+        for entry, result in zip(entries, results):
+            if isinstance(result, Exception):
+                log.warning("  Failed to scan %s: %s", entry["ip"], result)
                 continue
-            try:
-                # DNS resolution (uses DB cache)
-                hostname = await resolve_ip(ip, db=self.db)
-                entry["hostname"] = hostname
-
-                # Geolocation (uses DB cache)
-                await get_ip_geolocation(ip, db=self.db)
-
-                # Nmap scan of attacker (uses DB cache)
-                result = await scan_attacker_ip(ip, db=self.db)
-                scanned += 1
-                ports = result.get("open_ports", "")
-                log.info("  Scanned %s: ports=%s", ip, ports or "none")
-            except Exception as e:
-                log.warning("  Failed to scan %s: %s", ip, e)
+            scanned += 1
+            ports = result.get("open_ports", "")
+            log.info("  Scanned %s: ports=%s", entry["ip"], ports or "none")
 
         log.info("Glacial: scanned %d attacker IPs", scanned)
 
@@ -217,21 +260,37 @@ class CollectorDaemon:
         except Exception as e:
             log.warning("Prune failed: %s", e)
 
-        # Force all collections on first run
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self.stop, signum)
+
+        # Everything is due on the first pass; after that, sleep until the
+        # earliest deadline instead of waking up every second to check
+        self._wakeup = asyncio.Event()
         while self.running:
             try:
                 await self.collect_once()
             except Exception as e:
                 log.error("Collection cycle error: %s", e)
 
-            # Sleep in small increments for responsive shutdown
-            for _ in range(self.fast_interval):
-                if not self.running:
-                    break
-                await asyncio.sleep(1)
+            if not self.running:
+                break
+            delay = self._due_heap[0][0] - time.monotonic() if self._due_heap else self.fast_interval
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.5, delay))
+            except asyncio.TimeoutError:
+                pass
 
         log.info("Collector daemon stopped")
 
+    def stop(self, signum=None):
+        """Stop the run loop, waking it if it is asleep."""
+        if signum is not None:
+            log.info("Received signal %d, shutting down...", signum)
+        self.running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
 
 def main():
     import argparse
@@ -240,15 +299,8 @@ def main():
                         help=f"Fast-tier collection interval (default: {TIER_FAST}s)")
     args = parser.parse_args()
 
+    _buffer_logging()
     daemon = CollectorDaemon(fast_interval=args.interval)
-
-    def handle_signal(signum, frame):
-        log.info("Received signal %d, shutting down...", signum)
-        daemon.running = False
-
-    signal.signal(signal.SIGTERM, handle_signal)
-    signal.signal(signal.SIGINT, handle_signal)
-
     asyncio.run(daemon.run())
 
 
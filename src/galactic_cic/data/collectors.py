@@ -1,6 +1,8 @@
 """Async data collectors for GalacticCIC — shells out to system commands."""
 
 import asyncio
+import functools
+import glob
 import json
 import os
 import re
@@ -8,67 +10,255 @@ import time
 import urllib.request
 import urllib.error
 from datetime import datetime
+from collections.abc import Hashable
+from operator import itemgetter
 from typing import Any
 
-
-async def run_command(cmd: str, timeout: float = 10.0) -> tuple[str, str, int]:
-    """Run a shell command asynchronously and return (stdout, stderr, returncode)."""
+try:
+    # Optional: several times faster on the JSON the openclaw CLI emits.
+    # Its JSONDecodeError subclasses json's, so existing handlers still apply.
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Patterns used per output line, compiled once at import
+_TOKENS_RE = re.compile(r"(\d+k)/(\d+k)\s*\((\d+)%\)")  # "126k/80k (158%)"
+_DIGITS_RE = re.compile(r"(\d+)")
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_PTR_RE = re.compile(r"pointer\s+(.+)\.")
+_FROM_IP_RE = re.compile(r"from\s+(\d+\.\d+\.\d+\.\d+)")
+_SYSLOG_TS_RE = re.compile(r"(\w+\s+\d+\s+\d+:\d+:\d+)")  # "Feb 20 12:34:56"
+_ISO_TS_RE = re.compile(r"(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2})")
+_CHANNEL_ROW_RE = re.compile(r"│\s*(\S+)\s*│\s*(\S+)\s*│\s*(\S+)\s*│\s*(.*?)\s*│")
+_UPDATE_VER_RE = re.compile(r"update ([\d.]+(?:-\d+)?)")
+_APP_VER_RE = re.compile(r"app ([\d.]+(?:-\d+)?)")
+# One pass over `openclaw agents list`: agent header, Model: or Workspace:
+_AGENT_LINE_RE = re.compile(
+    r"^[ \t]*(?:- [ \t]*(?P<agent>\S.*?)|Model:(?P<model>.*?)|Workspace:(?P<workspace>.*?))[ \t]*$",
+    re.M,
+)
+
+# A command is either a shell string (needed for pipes) or an argv list,
+# which is exec'd directly without a /bin/sh in between.
+Command = str | list[str]
+
+# Commands currently executing: key -> task. Concurrent callers of the same
+# command await one subprocess instead of forking duplicates.
+_INFLIGHT: dict[Hashable, asyncio.Future] = {}
+
+
+def _cmd_key(cmd: Command, max_lines: int | None = None) -> Hashable:
+    key = cmd if isinstance(cmd, str) else tuple(cmd)
+    return key if max_lines is None else (key, max_lines)
+
+
+async def run_command(
+    cmd: Command, timeout: float = 10.0, max_lines: int | None = None
+) -> tuple[str, str, int]:
+    """Run a command asynchronously and return (stdout, stderr, returncode).
+
+    A string runs through the shell. An argv list is exec'd directly with
+    stderr discarded, as a `2>/dev/null` suffix would.
+    With max_lines, stdout is read line by line and the process is killed
+    once that many lines have arrived — `| head -n` without the pipe or
+    the full buffer.
+    Identical commands issued while one is still running share its result.
+    """
+    loop = asyncio.get_running_loop()
+    key = _cmd_key(cmd, max_lines)
+    fut = _INFLIGHT.get(key)
+    if fut is None or fut.get_loop() is not loop:
+        fut = loop.create_task(_spawn(cmd, timeout, max_lines))
+        _INFLIGHT[key] = fut
+        fut.add_done_callback(lambda f: _forget_inflight(key, f))
+    # Shielded so one caller being cancelled doesn't kill the shared run
+    return await asyncio.shield(fut)
+
+
+def _forget_inflight(key: Hashable, fut: asyncio.Future) -> None:
+    if _INFLIGHT.get(key) is fut:
+        del _INFLIGHT[key]
+
+
+async def _spawn(
+    cmd: Command, timeout: float, max_lines: int | None = None
+) -> tuple[str, str, int]:
+    # Nothing drains stderr while lines are streamed, so it is discarded
+    stderr_mode = (
+        asyncio.subprocess.PIPE
+        if isinstance(cmd, str) and max_lines is None
+        else asyncio.subprocess.DEVNULL
+    )
     try:
-        proc = await asyncio.create_subprocess_shell(
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        if isinstance(cmd, str):
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=stderr_mode,
+            )
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=stderr_mode,
+            )
+        if max_lines is not None:
+            stdout, rc = await asyncio.wait_for(
+                _read_lines(proc, max_lines), timeout=timeout
+            )
+            return stdout.decode("utf-8", errors="replace"), "", rc
         stdout, stderr = await asyncio.wait_for(
             proc.communicate(), timeout=timeout
         )
         return (
             stdout.decode("utf-8", errors="replace"),
-            stderr.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace") if stderr else "",
             proc.returncode or 0,
         )
+    except FileNotFoundError:
+        # Same outcome as the shell reporting "command not found"
+        return "", "", 127
     except asyncio.TimeoutError:
         return "", "Command timed out", 1
     except Exception as e:
         return "", str(e), 1
 
 
+async def _read_lines(
+    proc: asyncio.subprocess.Process, max_lines: int
+) -> tuple[bytes, int]:
+    """Read up to max_lines of stdout, then stop the process if it has more."""
+    lines: list[bytes] = []
+    while len(lines) < max_lines:
+        line = await proc.stdout.readline()
+        if not line:
+            break
+        lines.append(line)
+    # Only output that really continues past the cap counts as truncated;
+    # a command that printed exactly max_lines keeps its own exit status
+    truncated = len(lines) >= max_lines and bool(await proc.stdout.readline())
+    if truncated:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    rc = await proc.wait()
+    # Being cut off after enough output is not a failure
+    return b"".join(lines), 0 if truncated else (rc or 0)
+
+
+# ── Subprocess result cache ──
+# Several collectors run the same command in one refresh cycle
+# (`openclaw status` alone is read by four of them), so results are memoized
+# per command. TTLs stay below the dashboard tier intervals so a due tier
+# always sees fresh output.
+TTL_MEDIUM = 30   # cron
+TTL_SLOW = 60     # agents, openclaw status, security
+
+_CMD_CACHE: dict[Hashable, tuple[float, tuple[str, str, int]]] = {}
+
+
+async def cached_command(
+    cmd: Command,
+    ttl: float,
+    timeout: float = 10.0,
+    max_lines: int | None = None,
+) -> tuple[str, str, int]:
+    """Run a command through run_command, reusing its result for ttl seconds."""
+    now = time.monotonic()
+    key = _cmd_key(cmd, max_lines)
+    hit = _CMD_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    result = await run_command(cmd, timeout=timeout, max_lines=max_lines)
+    # Expiry counts from launch so a tier that fires exactly on schedule
+    # never gets served the previous cycle's output.
+    _CMD_CACHE[key] = (now + ttl, result)
+    return result
+
+
+def clear_command_cache() -> None:
+    """Drop all memoized command results (manual refresh)."""
+    _CMD_CACHE.clear()
+    _FIRST_OK.clear()
+
+
+# Fallback chain -> index of the argv that last succeeded. Most chains
+# exist for older openclaw releases; once one variant works, trying it
+# first saves a CLI cold start on every later refresh.
+_FIRST_OK: dict[tuple[tuple[str, ...], ...], int] = {}
+
+
+async def _run_first(
+    *argvs: list[str], ttl: float = 0, timeout: float = 10.0
+) -> tuple[str, str, int]:
+    """Python-side `a || b`: run each argv in turn until one exits 0.
+
+    The variant that succeeded last time is tried before the others.
+    """
+    chain = tuple(tuple(argv) for argv in argvs)
+    preferred = _FIRST_OK.get(chain, 0)
+    order = [preferred] + [i for i in range(len(argvs)) if i != preferred]
+    result = ("", "", 1)
+    for i in order:
+        if ttl:
+            result = await cached_command(argvs[i], ttl=ttl, timeout=timeout)
+        else:
+            result = await run_command(argvs[i], timeout=timeout)
+        if result[2] == 0:
+            _FIRST_OK[chain] = i
+            break
+    return result
+
+
+def _parse_agents_list(text: str) -> list[dict[str, Any]]:
+    """Parse `openclaw agents list` output into agent dicts."""
+    agents = []
+    current_agent = None
+    for match in _AGENT_LINE_RE.finditer(text):
+        raw, model, workspace = match.group("agent", "model", "workspace")
+        if raw is not None:
+            # New agent line: "- main (default) (galactic)"
+            current_agent = {
+                "name": raw.split("(")[0].strip(),
+                "status": "online",
+                "model": "",
+                "workspace": "",
+                "is_default": "(default)" in raw,
+            }
+            agents.append(current_agent)
+        elif current_agent is None:
+            continue
+        elif model is not None:
+            # Shorten model name
+            current_agent["model"] = (
+                model.strip().replace("anthropic/", "").replace("claude-", "")
+            )
+        else:
+            current_agent["workspace"] = workspace.strip()
+    return agents
+
+
 async def get_agents_data() -> dict[str, Any]:
     """Get agent fleet status from openclaw agents list with storage and tokens."""
-    stdout, stderr, rc = await run_command("openclaw agents list 2>/dev/null")
+    stdout, stderr, rc = await cached_command(
+        ["openclaw", "agents", "list"], ttl=TTL_SLOW
+    )
 
     agents = []
     if rc == 0 and stdout.strip():
-        current_agent = None
-        for line in stdout.strip().split("\n"):
-            line_stripped = line.strip()
-            if line_stripped.startswith("- "):
-                # New agent line: "- main (default) (galactic)"
-                raw = line_stripped[2:]
-                name = raw.split("(")[0].strip()
-                is_default = "(default)" in raw
-                current_agent = {
-                    "name": name,
-                    "status": "online",
-                    "model": "",
-                    "workspace": "",
-                    "is_default": is_default,
-                }
-                agents.append(current_agent)
-            elif current_agent and line_stripped.startswith("Model:"):
-                model = line_stripped.split(":", 1)[1].strip()
-                # Shorten model name
-                model = model.replace("anthropic/", "").replace("claude-", "")
-                current_agent["model"] = model
-            elif current_agent and line_stripped.startswith("Workspace:"):
-                current_agent["workspace"] = line_stripped.split(":", 1)[1].strip()
+        agents = _parse_agents_list(stdout)
 
     # Get storage sizes for each agent workspace
     for agent in agents:
         ws = agent.get("workspace", "")
         if ws:
             ws_expanded = ws.replace("~", "/home/spacetrucker")
-            size_out, _, size_rc = await run_command(f"du -sh {ws_expanded} 2>/dev/null")
+            size_out, _, size_rc = await cached_command(
+                ["du", "-sh", ws_expanded], ttl=TTL_SLOW
+            )
             if size_rc == 0 and size_out.strip():
                 agent["storage"] = size_out.strip().split()[0]
                 agent["storage_bytes"] = _parse_storage_bytes(agent["storage"])
@@ -80,7 +270,9 @@ async def get_agents_data() -> dict[str, Any]:
             agent["storage_bytes"] = 0
 
     # Get token usage per agent from openclaw status
-    status_out, _, status_rc = await run_command("openclaw status 2>/dev/null")
+    status_out, _, status_rc = await cached_command(
+        ["openclaw", "status"], ttl=TTL_SLOW
+    )
     if status_rc == 0 and status_out:
         for agent in agents:
             name = agent["name"]
@@ -91,7 +283,7 @@ async def get_agents_data() -> dict[str, Any]:
                 if f"agent:{name}:" in line:
                     session_count += 1
                     # Extract token info like "126k/80k (158%)"
-                    token_match = re.search(r'(\d+k)/(\d+k)\s*\((\d+)%\)', line)
+                    token_match = _TOKENS_RE.search(line)
                     if token_match:
                         used = int(token_match.group(1).replace('k', ''))
                         total_tokens += used
@@ -111,12 +303,13 @@ async def get_openclaw_status() -> dict[str, Any]:
         "version": "unknown",
     }
 
-    stdout, stderr, rc = await run_command(
-        "openclaw status --json 2>/dev/null || openclaw status 2>/dev/null"
+    stdout, _, rc = await _run_first(
+        ["openclaw", "status", "--json"], ["openclaw", "status"], ttl=TTL_SLOW
     )
+    data: dict[str, Any] = {}
     if rc == 0 and stdout.strip():
         try:
-            data = json.loads(stdout)
+            data = _json_loads(stdout)
             result["sessions"] = data.get(
                 "sessions", data.get("active_sessions", 0)
             )
@@ -126,7 +319,7 @@ async def get_openclaw_status() -> dict[str, Any]:
         except json.JSONDecodeError:
             for line in stdout.split("\n"):
                 if "session" in line.lower():
-                    match = re.search(r"(\d+)", line)
+                    match = _DIGITS_RE.search(line)
                     if match:
                         result["sessions"] = int(match.group(1))
                 if "model" in line.lower():
@@ -134,17 +327,39 @@ async def get_openclaw_status() -> dict[str, Any]:
                     if len(parts) > 1:
                         result["model"] = parts[1].strip()
 
-    stdout, stderr, rc = await run_command("openclaw gateway status 2>/dev/null")
-    if rc == 0:
+    # Newer CLIs report gateway and version in the JSON status; only fork
+    # the separate subcommands for the fields it did not cover.
+    gateway = data.get("gateway") if isinstance(data, dict) else None
+    if isinstance(gateway, dict):
+        gateway = gateway.get("status", gateway.get("state"))
+    version = data.get("version") if isinstance(data, dict) else None
+
+    lookups = {}
+    if not gateway:
+        lookups["gateway"] = cached_command(
+            ["openclaw", "gateway", "status"], ttl=TTL_SLOW
+        )
+    if not version:
+        lookups["version"] = _run_first(
+            ["openclaw", "--version"], ["openclaw", "version"], ttl=TTL_SLOW
+        )
+    outputs = dict(zip(lookups, await asyncio.gather(*lookups.values())))
+
+    if "gateway" in outputs:
+        gw_out, _, gw_rc = outputs["gateway"]
+        if gw_rc == 0:
+            gateway = gw_out
+    if gateway:
         result["gateway_status"] = (
-            "running" if "running" in stdout.lower() else "stopped"
+            "running" if "running" in str(gateway).lower() else "stopped"
         )
 
-    stdout, stderr, rc = await run_command(
-        "openclaw --version 2>/dev/null || openclaw version 2>/dev/null"
-    )
-    if rc == 0 and stdout.strip():
-        result["version"] = stdout.strip().split("\n")[0]
+    if "version" in outputs:
+        ver_out, _, ver_rc = outputs["version"]
+        if ver_rc == 0 and ver_out.strip():
+            version = ver_out.strip().split("\n")[0]
+    if version:
+        result["version"] = str(version)
 
     return result
 
@@ -153,8 +368,61 @@ async def get_openclaw_status() -> dict[str, Any]:
 _prev_cpu_stat: list[int] | None = None
 
 
+def _read_proc(path: str) -> str:
+    """Read a small /proc file, returning '' if it is unavailable."""
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def _tail_lines(path: str, max_lines: int, block_size: int = 64 * 1024) -> list[str]:
+    """Return the last *max_lines* lines of a file, reading from the end.
+
+    Only the trailing blocks needed are read, so the cost tracks the
+    window size rather than the size of the log file.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            data = b""
+            while pos > 0 and data.count(b"\n") <= max_lines:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+    except OSError:
+        return []
+    return data.decode("utf-8", errors="replace").splitlines()[-max_lines:]
+
+
+def _human_size(num_bytes: float) -> str:
+    """Format a byte count the way `df -h` does (e.g. '475M', '5.9G')."""
+    value = float(num_bytes)
+    for suffix in ("B", "K", "M", "G", "T"):
+        if value < 1024 or suffix == "T":
+            break
+        value /= 1024
+    if suffix == "B":
+        return f"{value:.0f}B"
+    return f"{value:.1f}{suffix}" if value < 10 else f"{value:.0f}{suffix}"
+
+
+def _format_uptime(seconds: float) -> str:
+    """Format seconds of uptime like `uptime` does (e.g. '3 days, 4:05')."""
+    days, rem = divmod(int(seconds), 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes = rem // 60
+    clock = f"{hours}:{minutes:02d}" if hours else f"{minutes} min"
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {clock}"
+    return clock
+
+
 async def get_server_health() -> dict[str, Any]:
-    """Get server health metrics from system commands."""
+    """Get server health metrics from /proc and statvfs (no subprocesses)."""
     result: dict[str, Any] = {
         "cpu_percent": 0.0,
         "mem_percent": 0.0,
@@ -171,63 +439,58 @@ async def get_server_health() -> dict[str, Any]:
         "uptime": "unknown",
     }
 
-    # Memory
-    stdout, _, rc = await run_command("free -h")
-    if rc == 0:
-        for line in stdout.strip().split("\n"):
-            if line.startswith("Mem:"):
-                parts = line.split()
-                if len(parts) >= 3:
-                    result["mem_total"] = parts[1]
-                    result["mem_used"] = parts[2]
-                    try:
-                        total_val = _parse_size(parts[1])
-                        used_val = _parse_size(parts[2])
-                        result["mem_total_mb"] = total_val * 1024
-                        result["mem_used_mb"] = used_val * 1024
-                        if total_val > 0:
-                            result["mem_percent"] = (used_val / total_val) * 100
-                    except (ValueError, IndexError):
-                        pass
-
-    # Disk
-    stdout, _, rc = await run_command("df -h /")
-    if rc == 0:
-        lines = stdout.strip().split("\n")
-        if len(lines) >= 2:
-            parts = lines[1].split()
-            if len(parts) >= 5:
-                result["disk_total"] = parts[1]
-                result["disk_used"] = parts[2]
-                result["disk_total_gb"] = _parse_size(parts[1])
-                result["disk_used_gb"] = _parse_size(parts[2])
-                try:
-                    result["disk_percent"] = float(parts[4].rstrip("%"))
-                except ValueError:
-                    pass
+    # Memory — same "used" definition as free(1): total minus available
+    meminfo = {}
+    for line in _read_proc("/proc/meminfo").splitlines():
+        key, _, value = line.partition(":")
+        parts = value.split()
+        if parts:
+            try:
+                meminfo[key] = int(parts[0])  # kB
+            except ValueError:
+                pass
+    total_kb = meminfo.get("MemTotal", 0)
+    if total_kb > 0:
+        avail_kb = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+        used_kb = total_kb - avail_kb
+        result["mem_total"] = _human_size(total_kb * 1024)
+        result["mem_used"] = _human_size(used_kb * 1024)
+        result["mem_total_mb"] = total_kb / 1024
+        result["mem_used_mb"] = used_kb / 1024
+        result["mem_percent"] = (used_kb / total_kb) * 100
+
+    # Disk — same percentage as df(1): used / (used + available to users)
+    try:
+        st = os.statvfs("/")
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        avail = st.f_bavail * st.f_frsize
+        result["disk_total"] = _human_size(total)
+        result["disk_used"] = _human_size(used)
+        result["disk_total_gb"] = total / 1024 ** 3
+        result["disk_used_gb"] = used / 1024 ** 3
+        if used + avail > 0:
+            result["disk_percent"] = used / (used + avail) * 100
+    except OSError:
+        pass
 
     # Load average and uptime
-    stdout, _, rc = await run_command("uptime")
-    if rc == 0:
-        match = re.search(
-            r"load average:\s*([\d.]+),?\s*([\d.]+),?\s*([\d.]+)", stdout
-        )
-        if match:
-            result["load_avg"] = [float(match.group(i)) for i in (1, 2, 3)]
-
-        match = re.search(r"up\s+(.+?),\s+\d+\s+user", stdout)
-        if match:
-            result["uptime"] = match.group(1).strip()
-        else:
-            match = re.search(r"up\s+(.+?),\s+load", stdout)
-            if match:
-                result["uptime"] = match.group(1).strip()
+    loadavg = _read_proc("/proc/loadavg").split()
+    if len(loadavg) >= 3:
+        try:
+            result["load_avg"] = [float(x) for x in loadavg[:3]]
+        except ValueError:
+            pass
+    try:
+        result["uptime"] = _format_uptime(float(_read_proc("/proc/uptime").split()[0]))
+    except (ValueError, IndexError):
+        pass
 
     # CPU from /proc/stat — compare against cached previous reading (no sleep)
     global _prev_cpu_stat
-    stdout, _, _ = await run_command("head -1 /proc/stat")
+    stat_line = _read_proc("/proc/stat").split("\n", 1)[0]
     try:
-        cpu_now = [int(x) for x in stdout.split()[1:8]]
+        cpu_now = [int(x) for x in stat_line.split()[1:8]]
         if _prev_cpu_stat is not None:
             idle_prev = _prev_cpu_stat[3] + _prev_cpu_stat[4]
             idle_now = cpu_now[3] + cpu_now[4]
@@ -265,99 +528,140 @@ def _parse_storage_bytes(size_str: str) -> int:
         return 0
 
 
+# Size suffix -> multiplier to GB
+_SIZE_MULT = {
+    "K": 1 / 1024 / 1024,
+    "M": 1 / 1024,
+    "G": 1,
+    "T": 1024,
+    "P": 1024 * 1024,
+}
+
+
 def _parse_size(size_str: str) -> float:
     """Parse size string like '3.2G' or '512M' to float in GB."""
     size_str = size_str.strip().upper()
-    multipliers = {
-        "K": 1 / 1024 / 1024,
-        "M": 1 / 1024,
-        "G": 1,
-        "T": 1024,
-        "P": 1024 * 1024,
-    }
-    for suffix, mult in multipliers.items():
-        if size_str.endswith(suffix):
-            try:
-                return float(size_str[:-1]) * mult
-            except ValueError:
-                return 0.0
+    if not size_str:
+        return 0.0
+    mult = _SIZE_MULT.get(size_str[-1])
     try:
-        return float(size_str) / (1024**3)
+        if mult is None:
+            return float(size_str) / (1024**3)
+        return float(size_str[:-1]) * mult
     except ValueError:
         return 0.0
 
 
+def _parse_cron_table(text: str) -> list[dict[str, Any]]:
+    """Parse the fixed-width `openclaw cron list` table into job dicts."""
+    jobs: list[dict[str, Any]] = []
+    lines = text.strip().split("\n")
+
+    # Skip Doctor diagnostic output — find the actual header line
+    header_idx = None
+    for i, line in enumerate(lines):
+        if line.startswith("ID") and "Name" in line and "Schedule" in line:
+            header_idx = i
+            break
+
+    if header_idx is None or header_idx + 1 >= len(lines):
+        return jobs
+
+    # Parse header to find column positions
+    header = lines[header_idx]
+    col_positions = {}
+    for col_name in ["Name", "Next", "Last", "Status", "Target", "Agent"]:
+        idx = header.find(col_name)
+        if idx >= 0:
+            col_positions[col_name] = idx
+
+    # Column boundaries are fixed for the whole table
+    name_start = col_positions.get("Name", 37)
+    next_start = col_positions.get("Next", 70)
+    last_start = col_positions.get("Last", 81)
+    status_start = col_positions.get("Status", 92)
+    # Use Target column as status end boundary if present, else Agent
+    status_end = col_positions.get("Target",
+                 col_positions.get("Agent", 112))
+    agent_start = col_positions.get("Agent", 112)
+
+    # Parse each data line using column positions
+    for line in lines[header_idx + 1:]:
+        if not line.strip():
+            continue
+        try:
+            name = line[name_start:next_start].strip().rstrip(".")[:22].strip()
+            next_run = line[next_start:last_start].strip()
+            last_run = line[last_start:status_start].strip()
+            status_field = line[status_start:status_end].strip() if status_end else line[status_start:].split()[0]
+            agent = line[agent_start:].strip().split()[0] if agent_start and len(line) > agent_start else ""
+
+            # Normalize status
+            status = "idle"
+            status_lower = status_field.lower()
+            if "error" in status_lower:
+                status = "error"
+            elif "running" in status_lower:
+                status = "running"
+            elif status_lower == "ok":
+                status = "ok"
+
+            # Clean up last_run
+            if last_run == "-":
+                last_run = ""
+
+            jobs.append({
+                "name": name,
+                "status": status,
+                "last_run": last_run,
+                "next_run": next_run,
+                "agent": agent,
+            })
+        except (IndexError, KeyError):
+            continue
+
+    return jobs
+
+
 async def get_cron_jobs() -> dict[str, Any]:
     """Get cron job status from openclaw cron list."""
-    stdout, stderr, rc = await run_command("openclaw cron list 2>/dev/null")
+    stdout, stderr, rc = await cached_command(
+        ["openclaw", "cron", "list"], ttl=TTL_MEDIUM
+    )
 
     jobs = []
     if rc == 0 and stdout.strip():
-        lines = stdout.strip().split("\n")
+        jobs = _parse_cron_table(stdout)
 
-        # Skip Doctor diagnostic output — find the actual header line
-        header_idx = None
-        for i, line in enumerate(lines):
-            if line.startswith("ID") and "Name" in line and "Schedule" in line:
-                header_idx = i
-                break
+    return {"jobs": jobs, "error": stderr if rc != 0 else None}
 
-        if header_idx is None or header_idx + 1 >= len(lines):
-            return {"jobs": jobs, "error": None}
 
-        # Parse header to find column positions
-        header = lines[header_idx]
-        col_positions = {}
-        for col_name in ["Name", "Next", "Last", "Status", "Target", "Agent"]:
-            idx = header.find(col_name)
-            if idx >= 0:
-                col_positions[col_name] = idx
+# Intrusion count for the security status; grep does the counting, so the
+# matching lines never leave the process
+_AUTH_FAIL_COUNT = [
+    "grep", "-c", "-E", "Failed password|Invalid user", "/var/log/auth.log",
+]
 
-        # Parse each data line using column positions
-        for line in lines[header_idx + 1:]:
-            if not line.strip():
-                continue
-            try:
-                name_start = col_positions.get("Name", 37)
-                next_start = col_positions.get("Next", 70)
-                last_start = col_positions.get("Last", 81)
-                status_start = col_positions.get("Status", 92)
-                # Use Target column as status end boundary if present, else Agent
-                status_end = col_positions.get("Target",
-                             col_positions.get("Agent", 112))
-                agent_start = col_positions.get("Agent", 112)
-
-                name = line[name_start:next_start].strip().rstrip(".")[:22].strip()
-                next_run = line[next_start:last_start].strip()
-                last_run = line[last_start:status_start].strip()
-                status_field = line[status_start:status_end].strip() if status_end else line[status_start:].split()[0]
-                agent = line[agent_start:].strip().split()[0] if agent_start and len(line) > agent_start else ""
-
-                # Normalize status
-                status = "idle"
-                status_lower = status_field.lower()
-                if "error" in status_lower:
-                    status = "error"
-                elif "running" in status_lower:
-                    status = "running"
-                elif status_lower == "ok":
-                    status = "ok"
-
-                # Clean up last_run
-                if last_run == "-":
-                    last_run = ""
-
-                jobs.append({
-                    "name": name,
-                    "status": status,
-                    "last_run": last_run,
-                    "next_run": next_run,
-                    "agent": agent,
-                })
-            except (IndexError, KeyError):
-                continue
+# The last 500 accepted and last 500 failed SSH lines, fetched as one window
+# the login summary splits in Python; tail keeps the output bounded however
+# large auth.log grows on a brute-forced host
+_AUTH_SSH_WINDOW = (
+    "{ grep 'Accepted' /var/log/auth.log | tail -500; "
+    "grep -E 'Failed password|Invalid user' /var/log/auth.log | tail -500; "
+    "} 2>/dev/null"
+)
 
-    return {"jobs": jobs, "error": stderr if rc != 0 else None}
+
+def _split_ssh_lines(text: str) -> tuple[list[str], list[str]]:
+    """Split auth.log SSH lines into (accepted, failed)."""
+    accepted: list[str] = []
+    failed: list[str] = []
+    for line in text.splitlines():
+        if "Accepted" in line:
+            accepted.append(line)
+        elif "Failed password" in line or "Invalid user" in line:
+            failed.append(line)
+    return accepted, failed
 
 
 async def get_security_status() -> dict[str, Any]:
@@ -371,20 +675,17 @@ async def get_security_status() -> dict[str, Any]:
         "root_login_enabled": True,
     }
 
-    stdout, _, rc = await run_command(
-        "grep -c 'Failed password\\|Invalid user' /var/log/auth.log 2>/dev/null "
-        "|| echo 0"
-    )
-    try:
-        result["ssh_intrusions"] = int(stdout.strip())
-    except ValueError:
-        pass
+    # rc 1 is grep's "no matches" (it still prints 0); a missing log is rc 2
+    stdout, _, rc = await cached_command(_AUTH_FAIL_COUNT, ttl=TTL_SLOW)
+    count = stdout.strip()
+    if rc in (0, 1) and count.isdigit():
+        result["ssh_intrusions"] = int(count)
 
     # Get detailed port info — prefer nmap, fall back to ss
     ports_list = []
-    nmap_out, _, nmap_rc = await run_command(
-        "nmap -sT -O localhost 2>/dev/null || nmap -sT localhost 2>/dev/null",
-        timeout=15.0
+    nmap_out, _, nmap_rc = await _run_first(
+        ["nmap", "-sT", "-O", "localhost"], ["nmap", "-sT", "localhost"],
+        ttl=TTL_SLOW, timeout=15.0,
     )
     if nmap_rc == 0 and "open" in nmap_out:
         for line in nmap_out.split("\n"):
@@ -402,7 +703,7 @@ async def get_security_status() -> dict[str, Any]:
                     })
     else:
         # Fallback to ss -tlnp
-        ss_out, _, ss_rc = await run_command("ss -tlnp 2>/dev/null")
+        ss_out, _, ss_rc = await cached_command(["ss", "-tlnp"], ttl=TTL_SLOW)
         if ss_rc == 0:
             for line in ss_out.strip().split("\n")[1:]:  # skip header
                 parts = line.split()
@@ -414,7 +715,7 @@ async def get_security_status() -> dict[str, Any]:
                     process = ""
                     for p in parts:
                         if "users:" in p:
-                            proc_match = re.search(r'"([^"]+)"', p)
+                            proc_match = _QUOTED_RE.search(p)
                             if proc_match:
                                 process = proc_match.group(1)
                             break
@@ -427,18 +728,20 @@ async def get_security_status() -> dict[str, Any]:
     result["listening_ports"] = len(ports_list)
     result["ports_detail"] = ports_list
 
-    stdout, _, _ = await run_command("ufw status 2>/dev/null || echo inactive")
+    # A failed probe leaves stdout empty, which reads as ufw/fail2ban
+    # inactive and root login enabled below.
+    stdout, _, _ = await cached_command(["ufw", "status"], ttl=TTL_SLOW)
     result["ufw_active"] = (
         "active" in stdout.lower() and "inactive" not in stdout.lower()
     )
 
-    stdout, _, _ = await run_command(
-        "systemctl is-active fail2ban 2>/dev/null || echo inactive"
+    stdout, _, _ = await cached_command(
+        ["systemctl", "is-active", "fail2ban"], ttl=TTL_SLOW
     )
     result["fail2ban_active"] = stdout.strip() == "active"
 
-    stdout, _, _ = await run_command(
-        "grep -E '^PermitRootLogin' /etc/ssh/sshd_config 2>/dev/null || echo 'yes'"
+    stdout, _, _ = await cached_command(
+        ["grep", "-E", "^PermitRootLogin", "/etc/ssh/sshd_config"], ttl=TTL_SLOW
     )
     result["root_login_enabled"] = "no" not in stdout.lower()
 
@@ -446,14 +749,16 @@ async def get_security_status() -> dict[str, Any]:
 
 
 async def get_network_activity() -> dict[str, Any]:
-    """Parse ss -tnp to count active connections and extract peer IPs."""
+    """Parse ss -tn to count active connections and extract peer IPs."""
     result: dict[str, Any] = {
         "active_connections": 0,
         "unique_ips": 0,
         "peer_ips": {},  # ip -> count
     }
 
-    stdout, _, rc = await run_command("ss -tnp 2>/dev/null")
+    # No -p: only peer addresses are used, and resolving the owning
+    # process makes ss walk every /proc/<pid>/fd on the host
+    stdout, _, rc = await run_command(["ss", "-tn"])
     if rc != 0 or not stdout.strip():
         return result
 
@@ -480,18 +785,46 @@ async def get_network_activity() -> dict[str, Any]:
     return result
 
 
+# In-process lookup memos: ip -> (monotonic expiry, value). The same IPs
+# come back every refresh, so these answer before the DB is queried.
+DNS_MEMO_TTL = 3600
+GEO_MEMO_TTL = 86400
+_DNS_MEMO: dict[str, tuple[float, str]] = {}
+_GEO_MEMO: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+def _memo_get(memo: dict, ip: str):
+    hit = memo.get(ip)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def clear_lookup_memos() -> None:
+    """Forget in-process DNS and geolocation results."""
+    _DNS_MEMO.clear()
+    _GEO_MEMO.clear()
+
+
 async def resolve_ip(ip: str, db=None) -> str:
     """Resolve an IP to hostname via dig -x. Uses DB cache with 24h TTL."""
+    hostname = _memo_get(_DNS_MEMO, ip)
+    if hostname is not None:
+        return hostname
+
     # Check cache first
     if db is not None:
         row = db.fetchone(
             "SELECT hostname, resolved_at FROM dns_cache WHERE ip = ?", (ip,)
         )
         if row and (time.time() - row["resolved_at"]) < 86400:
+            _DNS_MEMO[ip] = (time.monotonic() + DNS_MEMO_TTL, row["hostname"])
             return row["hostname"]
 
     # Async DNS resolution via dig
-    stdout, _, rc = await run_command(f"dig -x {ip} +short +time=2 +tries=1 2>/dev/null", timeout=5.0)
+    stdout, _, rc = await run_command(
+        ["dig", "-x", ip, "+short", "+time=2", "+tries=1"], timeout=5.0
+    )
     hostname = ""
     if rc == 0 and stdout.strip():
         # dig returns FQDN with trailing dot
@@ -499,9 +832,9 @@ async def resolve_ip(ip: str, db=None) -> str:
 
     if not hostname:
         # Fallback to host command
-        stdout, _, rc = await run_command(f"host {ip} 2>/dev/null", timeout=5.0)
+        stdout, _, rc = await run_command(["host", ip], timeout=5.0)
         if rc == 0 and "domain name pointer" in stdout:
-            match = re.search(r"pointer\s+(.+)\.", stdout)
+            match = _PTR_RE.search(stdout)
             if match:
                 hostname = match.group(1)
 
@@ -517,6 +850,7 @@ async def resolve_ip(ip: str, db=None) -> str:
         )
         db.commit()
 
+    _DNS_MEMO[ip] = (time.monotonic() + DNS_MEMO_TTL, hostname)
     return hostname
 
 
@@ -541,111 +875,163 @@ async def get_top_ips(network_data: dict, db=None, limit: int = 3) -> list[dict[
     return results
 
 
+def _tally_ssh_ips(lines: list[str]) -> list[dict[str, Any]]:
+    """Count logins per source IP; return the top 3 by count."""
+    ips: dict[str, dict] = {}
+    for line in lines:
+        ip_match = _FROM_IP_RE.search(line)
+        if ip_match:
+            time_match = _SYSLOG_TS_RE.match(line)
+            ip = ip_match.group(1)
+            ts = time_match.group(1) if time_match else ""
+            if ip not in ips:
+                ips[ip] = {"count": 0, "last_seen": ts}
+            ips[ip]["count"] += 1
+            ips[ip]["last_seen"] = ts
+
+    return [
+        {"ip": ip, "count": info["count"], "last_seen": info["last_seen"]}
+        for ip, info in sorted(ips.items(), key=lambda x: x[1]["count"], reverse=True)[:3]
+    ]
+
+
 async def get_ssh_login_summary() -> dict[str, Any]:
     """Parse /var/log/auth.log for SSH accepted/failed logins in last 24h."""
-    result: dict[str, Any] = {
-        "accepted": [],  # list of {ip, count, last_seen}
-        "failed": [],    # list of {ip, count, last_seen}
+    stdout, _, _ = await cached_command(_AUTH_SSH_WINDOW, ttl=TTL_SLOW)
+    accepted, failed = _split_ssh_lines(stdout)
+    return {
+        "accepted": _tally_ssh_ips(accepted),  # list of {ip, count, last_seen}
+        "failed": _tally_ssh_ips(failed),      # list of {ip, count, last_seen}
     }
 
-    # Get accepted SSH logins
-    stdout, _, rc = await run_command(
-        "grep 'Accepted' /var/log/auth.log 2>/dev/null | tail -500"
-    )
-    accepted_ips: dict[str, dict] = {}
-    if rc == 0 and stdout.strip():
-        for line in stdout.strip().split("\n"):
-            if not line.strip():
-                continue
-            ip_match = re.search(r'from\s+(\d+\.\d+\.\d+\.\d+)', line)
-            time_match = re.match(r'(\w+\s+\d+\s+\d+:\d+:\d+)', line)
-            if ip_match:
-                ip = ip_match.group(1)
-                ts = time_match.group(1) if time_match else ""
-                if ip not in accepted_ips:
-                    accepted_ips[ip] = {"count": 0, "last_seen": ts}
-                accepted_ips[ip]["count"] += 1
-                accepted_ips[ip]["last_seen"] = ts
-
-    # Get failed SSH logins
-    stdout, _, rc = await run_command(
-        "grep -E 'Failed password|Invalid user' /var/log/auth.log 2>/dev/null | tail -500"
-    )
-    failed_ips: dict[str, dict] = {}
-    if rc == 0 and stdout.strip():
-        for line in stdout.strip().split("\n"):
-            if not line.strip():
+
+@functools.lru_cache(maxsize=1024)
+def _parse_event_time(text: str) -> float | None:
+    """Epoch seconds for an ISO or syslog timestamp, or None if neither."""
+    try:
+        return datetime.fromisoformat(text.strip()).timestamp()
+    except ValueError:
+        pass
+    match = _SYSLOG_TS_RE.match(text)
+    if match:
+        now = datetime.now()
+        # Syslog omits the year; a date ahead of today is from last year
+        for year in (now.year, now.year - 1):
+            try:
+                parsed = datetime.strptime(
+                    f"{year} {match.group(1)}", "%Y %b %d %H:%M:%S"
+                )
+            except ValueError:
                 continue
-            ip_match = re.search(r'from\s+(\d+\.\d+\.\d+\.\d+)', line)
-            time_match = re.match(r'(\w+\s+\d+\s+\d+:\d+:\d+)', line)
-            if ip_match:
-                ip = ip_match.group(1)
-                ts = time_match.group(1) if time_match else ""
-                if ip not in failed_ips:
-                    failed_ips[ip] = {"count": 0, "last_seen": ts}
-                failed_ips[ip]["count"] += 1
-                failed_ips[ip]["last_seen"] = ts
-
-    # Sort by count, top 3
-    for ip, info in sorted(accepted_ips.items(), key=lambda x: x[1]["count"], reverse=True)[:3]:
-        result["accepted"].append({"ip": ip, "count": info["count"], "last_seen": info["last_seen"]})
-
-    for ip, info in sorted(failed_ips.items(), key=lambda x: x[1]["count"], reverse=True)[:3]:
-        result["failed"].append({"ip": ip, "count": info["count"], "last_seen": info["last_seen"]})
+            if parsed <= now:
+                return parsed.timestamp()
+        return None
+    return None
 
-    return result
 
+def _event_ts(text: str) -> float:
+    """Sortable epoch for an event time string; 0.0 when unparseable.
 
-async def get_activity_log(limit: int = 50) -> list[dict[str, Any]]:
-    """Get recent activity from various log sources."""
+    Bare "HH:MM" stamps are taken as today and not cached, since their
+    meaning shifts at midnight.
+    """
+    ts = _parse_event_time(text)
+    if ts is not None:
+        return ts
+    try:
+        hm = datetime.strptime(text.strip(), "%H:%M")
+    except ValueError:
+        return 0.0
+    return datetime.now().replace(
+        hour=hm.hour, minute=hm.minute, second=0, microsecond=0
+    ).timestamp()
+
+
+def _parse_auth_events(text: str) -> list[dict[str, Any]]:
+    """Turn auth.log lines into ssh activity events."""
     events: list[dict[str, Any]] = []
+    for line in text.strip().split("\n"):
+        if line.strip():
+            match = _SYSLOG_TS_RE.match(line)
+            timestamp = match.group(1) if match else "unknown"
+            events.append({
+                "time": timestamp,
+                "message": (
+                    line[len(timestamp):].strip() if match else line
+                ),
+                "type": "ssh",
+                "level": "info",
+                "_ts": _event_ts(timestamp),
+            })
+    return events
 
-    stdout, _, rc = await run_command(
-        "grep -E 'Accepted|session opened' /var/log/auth.log 2>/dev/null | tail -10"
-    )
-    if rc == 0:
-        for line in stdout.strip().split("\n"):
-            if line.strip():
-                match = re.match(r"(\w+\s+\d+\s+\d+:\d+:\d+)", line)
-                timestamp = match.group(1) if match else "unknown"
+
+def _parse_openclaw_events(text: str) -> list[dict[str, Any]]:
+    """Parse `openclaw system events` output (JSON list or plain lines)."""
+    events: list[dict[str, Any]] = []
+    try:
+        data = _json_loads(text)
+        if isinstance(data, list):
+            for event in data:
+                event_time = event.get(
+                    "time", event.get("timestamp", "unknown")
+                )
                 events.append({
-                    "time": timestamp,
-                    "message": (
-                        line[len(timestamp):].strip() if match else line
+                    "time": event_time,
+                    "message": event.get(
+                        "message", event.get("text", str(event))
                     ),
-                    "type": "ssh",
+                    "type": event.get("type", "openclaw"),
+                    "level": event.get("level", "info"),
+                    "_ts": _event_ts(str(event_time)),
+                })
+    except json.JSONDecodeError:
+        now = datetime.now()
+        for line in text.strip().split("\n")[:20]:
+            if line.strip():
+                events.append({
+                    "time": now.strftime("%H:%M"),
+                    "message": line.strip(),
+                    "type": "openclaw",
                     "level": "info",
+                    "_ts": now.timestamp(),
                 })
+    return events
 
-    stdout, _, rc = await run_command(
-        "openclaw system events --limit 20 --json 2>/dev/null "
-        "|| openclaw system events --limit 20 2>/dev/null"
+
+# Sort key for event dicts; every parser stamps "_ts" (epoch seconds)
+_BY_TS = itemgetter("_ts")
+
+
+def _recent_auth_lines() -> list[str]:
+    """Login lines from the tail of auth.log (blocking file I/O)."""
+    return [
+        line for line in _tail_lines("/var/log/auth.log", 2000)
+        if "Accepted" in line or "session opened" in line
+    ]
+
+
+async def get_activity_log(limit: int = 50) -> list[dict[str, Any]]:
+    """Get recent activity from various log sources."""
+    events: list[dict[str, Any]] = []
+
+    # The auth.log scan runs on a worker thread so it neither blocks the
+    # event loop nor waits for the openclaw command to finish first
+    recent, (stdout, _, rc) = await asyncio.gather(
+        asyncio.to_thread(_recent_auth_lines),
+        _run_first(
+            ["openclaw", "system", "events", "--limit", "20", "--json"],
+            ["openclaw", "system", "events", "--limit", "20"],
+        ),
     )
+    if recent:
+        events.extend(_parse_auth_events("\n".join(recent[-10:])))
+
     if rc == 0 and stdout.strip():
-        try:
-            data = json.loads(stdout)
-            if isinstance(data, list):
-                for event in data:
-                    events.append({
-                        "time": event.get(
-                            "time", event.get("timestamp", "unknown")
-                        ),
-                        "message": event.get(
-                            "message", event.get("text", str(event))
-                        ),
-                        "type": event.get("type", "openclaw"),
-                        "level": event.get("level", "info"),
-                    })
-        except json.JSONDecodeError:
-            for line in stdout.strip().split("\n")[:20]:
-                if line.strip():
-                    events.append({
-                        "time": datetime.now().strftime("%H:%M"),
-                        "message": line.strip(),
-                        "type": "openclaw",
-                        "level": "info",
-                    })
+        events.extend(_parse_openclaw_events(stdout))
 
+    # Most recent first, across both sources
+    events.sort(key=_BY_TS, reverse=True)
     return events[:limit]
 
 
@@ -658,6 +1044,10 @@ async def get_ip_geolocation(ip: str, db=None) -> dict[str, str]:
     """Fetch IP geolocation from ip-api.com. Cached 7 days in geo_cache table."""
     global _geo_last_request
 
+    geo = _memo_get(_GEO_MEMO, ip)
+    if geo is not None:
+        return geo
+
     # Check cache first
     if db is not None:
         row = db.fetchone(
@@ -665,11 +1055,13 @@ async def get_ip_geolocation(ip: str, db=None) -> dict[str, str]:
             (ip,),
         )
         if row and (time.time() - row["resolved_at"]) < 7 * 86400:
-            return {
+            geo = {
                 "country_code": row["country_code"],
                 "city": row["city"],
                 "isp": row["isp"],
             }
+            _GEO_MEMO[ip] = (time.monotonic() + GEO_MEMO_TTL, geo)
+            return geo
 
     result = {"country_code": "?", "city": "", "isp": ""}
 
@@ -693,7 +1085,7 @@ async def get_ip_geolocation(ip: str, db=None) -> dict[str, str]:
             ),
             timeout=5.0,
         )
-        data = json.loads(response.read().decode())
+        data = _json_loads(response.read())
         result["country_code"] = data.get("countryCode", "?")
         result["city"] = data.get("city", "")
         result["isp"] = data.get("isp", "")
@@ -709,6 +1101,7 @@ async def get_ip_geolocation(ip: str, db=None) -> dict[str, str]:
         )
         db.commit()
 
+    _GEO_MEMO[ip] = (time.monotonic() + GEO_MEMO_TTL, result)
     return result
 
 
@@ -729,7 +1122,8 @@ async def scan_attacker_ip(ip: str, db=None) -> dict[str, str]:
     result = {"open_ports": "", "os_guess": ""}
 
     stdout, stderr, rc = await run_command(
-        f"nmap -sS -T2 -Pn --max-retries 2 --open {ip} 2>/dev/null", timeout=60.0
+        ["nmap", "-sS", "-T2", "-Pn", "--max-retries", "2", "--open", ip],
+        timeout=60.0,
     )
     if rc == 0 and stdout:
         open_ports = []
@@ -779,10 +1173,10 @@ async def scan_attacker_ip(ip: str, db=None) -> dict[str, str]:
 
 async def scan_attacker_ip_live(ip: str):
     """Nmap stealth scan yielding output lines as they stream in."""
-    cmd = f"nmap -sS -T2 -Pn --max-retries 2 --open {ip}"
+    argv = ["nmap", "-sS", "-T2", "-Pn", "--max-retries", "2", "--open", ip]
     try:
-        proc = await asyncio.create_subprocess_shell(
-            cmd,
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -804,14 +1198,13 @@ async def get_openclaw_logs(limit: int = 20) -> list[dict[str, Any]]:
 
     # Try filesystem first
     log_dir = os.path.expanduser("~/.openclaw/logs")
-    stdout, _, rc = await run_command(
-        f"tail -20 {log_dir}/*.log 2>/dev/null", timeout=5.0
-    )
+    log_files = sorted(glob.glob(os.path.join(log_dir, "*.log")))
+    stdout, rc = "", 1
+    if log_files:
+        stdout, _, rc = await run_command(["tail", "-20", *log_files], timeout=5.0)
     if rc != 0 or not stdout.strip():
         # Fallback to openclaw CLI
-        stdout, _, rc = await run_command(
-            "openclaw logs 2>/dev/null", timeout=5.0
-        )
+        stdout, _, rc = await run_command(["openclaw", "logs"], timeout=5.0)
 
     if rc == 0 and stdout.strip():
         for line in stdout.strip().split("\n")[-limit:]:
@@ -819,13 +1212,14 @@ async def get_openclaw_logs(limit: int = 20) -> list[dict[str, Any]]:
             if not line or line.startswith("==>"):
                 continue
             # Try to parse timestamp
-            time_str = datetime.now().strftime("%H:%M")
-            ts_match = re.match(
-                r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2})', line
-            )
+            now = datetime.now()
+            time_str = now.strftime("%H:%M")
+            ts = now.timestamp()
+            ts_match = _ISO_TS_RE.match(line)
             if ts_match:
                 try:
                     time_str = ts_match.group(1).split("T")[-1].split(" ")[-1][:5]
+                    ts = _event_ts(ts_match.group(1)) or ts
                 except Exception:
                     pass
             # Detect level
@@ -841,6 +1235,7 @@ async def get_openclaw_logs(limit: int = 20) -> list[dict[str, Any]]:
                 "message": line[:80],
                 "type": "openclaw",
                 "level": level,
+                "_ts": ts,
             })
 
     return events[-limit:]
@@ -891,7 +1286,7 @@ async def get_top_processes(count: int = 5) -> list[dict[str, Any]]:
     Returns list of dicts: pid, user, cpu, mem, command.
     """
     stdout, stderr, rc = await run_command(
-        f"ps aux --sort=-%cpu | head -{count + 1}"
+        ["ps", "aux", "--sort=-%cpu"], max_lines=count + 1
     )
     if rc != 0 or not stdout.strip():
         return []
@@ -916,7 +1311,9 @@ async def get_top_processes(count: int = 5) -> list[dict[str, Any]]:
 
 async def get_channels_status() -> list[dict[str, str]]:
     """Parse channel status from 'openclaw status' output."""
-    stdout, stderr, rc = await run_command("openclaw status 2>/dev/null")
+    stdout, stderr, rc = await cached_command(
+        ["openclaw", "status"], ttl=TTL_SLOW
+    )
     if rc != 0 or not stdout:
         return []
 
@@ -931,7 +1328,7 @@ async def get_channels_status() -> list[dict[str, str]]:
             if line.strip() and not line.strip().startswith("│") and not line.strip().startswith("├") and not line.strip().startswith("└") and not line.strip().startswith("┌") and not line.strip().startswith("─"):
                 if "Sessions" in line or "Security" in line or "FAQ" in line:
                     break
-            m = re.match(r"│\s*(\S+)\s*│\s*(\S+)\s*│\s*(\S+)\s*│\s*(.*?)\s*│", line)
+            m = _CHANNEL_ROW_RE.match(line)
             if m:
                 name = m.group(1).strip()
                 if name in ("Channel", "─", "──") or name.startswith("─"):
@@ -949,7 +1346,9 @@ async def get_update_status() -> dict[str, Any]:
     """Check for OpenClaw updates from 'openclaw status' output."""
     result = {"available": False, "current": "", "latest": ""}
 
-    stdout, stderr, rc = await run_command("openclaw status 2>/dev/null")
+    stdout, stderr, rc = await cached_command(
+        ["openclaw", "status"], ttl=TTL_SLOW
+    )
     if rc != 0 or not stdout:
         return result
 
@@ -957,18 +1356,20 @@ async def get_update_status() -> dict[str, Any]:
         # Check overview table for update info
         if "Update" in line and "available" in line:
             result["available"] = True
-            m = re.search(r"update ([\d.]+(?:-\d+)?)", line)
+            m = _UPDATE_VER_RE.search(line)
             if m:
                 result["latest"] = m.group(1)
         # Get current version from Gateway line
         if "Gateway" in line and "app " in line:
-            m = re.search(r"app ([\d.]+(?:-\d+)?)", line)
+            m = _APP_VER_RE.search(line)
             if m:
                 result["current"] = m.group(1)
 
     # Also try --version for current
     if not result["current"]:
-        stdout, stderr, rc = await run_command("openclaw --version 2>/dev/null")
+        stdout, stderr, rc = await cached_command(
+            ["openclaw", "--version"], ttl=TTL_SLOW
+        )
         if rc == 0 and stdout.strip():
             result["current"] = stdout.strip().split("\n")[0]
 
@@ -3,6 +3,7 @@
 import os
 import sqlite3
 import time
+from contextlib import contextmanager
 
 
 # Default database location
@@ -98,6 +99,14 @@ CREATE TABLE IF NOT EXISTS geo_cache (
     resolved_at REAL NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS refresh_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp REAL NOT NULL,
+    duration_ms INTEGER DEFAULT 0,
+    tasks_run INTEGER DEFAULT 0,
+    failures INTEGER DEFAULT 0
+);
+
 CREATE INDEX IF NOT EXISTS idx_agent_ts ON agent_metrics(timestamp);
 CREATE INDEX IF NOT EXISTS idx_server_ts ON server_metrics(timestamp);
 CREATE INDEX IF NOT EXISTS idx_security_ts ON security_metrics(timestamp);
@@ -120,16 +129,22 @@ class MetricsDB:
         if db_path is None:
             db_path = DEFAULT_DB_PATH
         self.db_path = db_path
+        self._batch_depth = 0
 
         # Ensure directory exists
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
-        self.conn = sqlite3.connect(self.db_path)
+        # The dashboard opens the DB on the UI thread but queries it from
+        # its refresh loop and executor threads, so allow cross-thread use
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
-        # WAL mode for concurrent reads during writes
+        # WAL mode for concurrent reads during writes; with WAL, NORMAL
+        # sync only fsyncs at checkpoints and cannot corrupt the DB
         self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         self._init_schema()
 
     def _init_schema(self):
@@ -156,8 +171,24 @@ class MetricsDB:
         return self.conn.executemany(sql, params_list)
 
     def commit(self):
-        """Commit pending transaction."""
-        self.conn.commit()
+        """Commit pending transaction (deferred while inside batch())."""
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """Group several writers' commits into one transaction.
+
+        The recorder commits after every record_* call; wrapping a refresh's
+        worth of them in batch() turns those into a single commit on exit.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
 
     def fetchone(self, sql, params=()):
         """Execute and fetch one row."""
@@ -177,6 +208,7 @@ class MetricsDB:
         tables = [
             "agent_metrics", "server_metrics", "cron_metrics",
             "security_metrics", "port_scans", "network_metrics",
+            "refresh_stats",
         ]
         for table in tables:
             self.conn.execute(
@@ -209,6 +241,26 @@ class MetricsDB:
             (cutoff, limit),
         ).fetchall()
 
+    def get_recent_server_columns(self, hours=1, limit=20):
+        """Get recent cpu/mem/disk percentages as oldest-first columns.
+
+        Percentages are computed in SQL and the rows transposed, so sparkline
+        callers get ready-to-plot lists instead of walking row by row.
+        """
+        cutoff = time.time() - (hours * 3600)
+        rows = self.conn.execute(
+            "SELECT cpu, mem, disk FROM ("
+            "SELECT timestamp, COALESCE(cpu_percent, 0) AS cpu, "
+            "COALESCE(mem_used_mb * 100.0 / NULLIF(mem_total_mb, 0), 0) AS mem, "
+            "COALESCE(disk_used_gb * 100.0 / NULLIF(disk_total_gb, 0), 0) AS disk "
+            "FROM server_metrics WHERE timestamp > ? "
+            "ORDER BY timestamp DESC LIMIT ?"
+            ") ORDER BY timestamp",
+            (cutoff, limit),
+        ).fetchall()
+        cpu, mem, disk = (list(col) for col in zip(*rows)) if rows else ([], [], [])
+        return {"cpu": cpu, "mem": mem, "disk": disk}
+
     def get_server_averages(self, hours=24):
         """Get 24h averages for sparkline reference lines."""
         cutoff = time.time() - (hours * 3600)
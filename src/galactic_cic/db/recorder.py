@@ -121,6 +121,21 @@ class MetricsRecorder:
             )
         self.db.commit()
 
+    def record_refresh_stats(self, stats):
+        """Record how long a collection cycle took and how it went."""
+        if not stats:
+            return
+        self.db.execute(
+            "INSERT INTO refresh_stats "
+            "(timestamp, duration_ms, tasks_run, failures) "
+            "VALUES (?, ?, ?, ?)",
+            (time.time(),
+             stats.get("duration_ms", 0),
+             stats.get("tasks_run", 0),
+             stats.get("failures", 0)),
+        )
+        self.db.commit()
+
     def record_sitrep(self, channels=None, update_info=None, action_items=None):
         """Cache SITREP data (channels, update, action items) to SQLite."""
         import json
@@ -22,6 +22,10 @@ class ActivityLogPanel(BasePanel):
         self.errors = []
         self.ext_ip_summary = []
         self._filter = ""
+        # Filtered events and their formatted (line, level) pairs, built once
+        # per data/filter change rather than on every frame.
+        self._filtered = None
+        self._recent_lines = None
 
     def update(self, events, errors=None, ext_ip_summary=None):
         """Update panel data from collectors."""
@@ -30,10 +34,35 @@ class ActivityLogPanel(BasePanel):
             self.errors = errors
         if ext_ip_summary is not None:
             self.ext_ip_summary = ext_ip_summary
+        self._filtered = self._recent_lines = None
 
     def set_filter(self, filter_text):
         """Set filter for activity log."""
         self._filter = filter_text
+        self._filtered = self._recent_lines = None
+
+    def _filtered_events(self):
+        """Events matching the current filter (cached until the next update)."""
+        if self._filtered is None:
+            if self._filter:
+                needle = self._filter.lower()
+                self._filtered = [
+                    e for e in self.events
+                    if needle in e.get("message", "").lower()
+                    or needle in e.get("type", "").lower()
+                ]
+            else:
+                self._filtered = self.events
+        return self._filtered
+
+    def _formatted_recent(self):
+        """(line, level) pairs for the RECENT section, formatted in one pass."""
+        if self._recent_lines is None:
+            self._recent_lines = [
+                (self._format_line(e), e.get("level", "info"))
+                for e in self._filtered_events()
+            ]
+        return self._recent_lines
 
     @staticmethod
     def _format_event(event):
@@ -54,13 +83,7 @@ class ActivityLogPanel(BasePanel):
         else:
             style = "white"
 
-        type_icons = {
-            "ssh": "\U0001f511",
-            "cron": "\u23f0",
-            "openclaw": "\U0001f980",
-            "system": "\U0001f4bb",
-        }
-        icon = type_icons.get(event_type, "\u2022")
+        icon = ActivityLogPanel.TYPE_ICONS.get(event_type, "\u2022")
         st.append(f"{icon} ", "green")
 
         if len(message) > 60:
@@ -96,14 +119,6 @@ class ActivityLogPanel(BasePanel):
             left_w = width
             ip_col_w = 0
 
-        filtered = self.events
-        if self._filter:
-            filtered = [
-                e for e in self.events
-                if self._filter.lower() in e.get("message", "").lower()
-                or self._filter.lower() in e.get("type", "").lower()
-            ]
-
         # ── Left side: ERRORS + RECENT ──
         row = 0
         self._safe_addstr(win, y + row, x, " ERRORS:", self.c_table_heading, left_w)
@@ -131,11 +146,9 @@ class ActivityLogPanel(BasePanel):
             self._safe_addstr(win, y + row, x, " RECENT:", self.c_table_heading, left_w)
             row += 1
 
-        for event in filtered[:(height - row)]:
+        for line, level in self._formatted_recent()[:(height - row)]:
             if row >= height:
                 break
-            line = self._format_line(event)
-            level = event.get("level", "info")
             attr = self.c_normal
             if level == "error":
                 attr = self.c_error
@@ -200,15 +213,7 @@ class ActivityLogPanel(BasePanel):
             self._safe_addstr(win, y + row, x, "  RECENT", self.c_table_heading, width)
             row += 1
 
-        filtered = self.events
-        if self._filter:
-            filtered = [
-                e for e in self.events
-                if self._filter.lower() in e.get("message", "").lower()
-                or self._filter.lower() in e.get("type", "").lower()
-            ]
-
-        for event in filtered:
+        for event in self._filtered_events():
             if row >= height:
                 break
             time_str = event.get("time", "??:??")
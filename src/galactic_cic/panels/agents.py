@@ -15,6 +15,9 @@ class AgentFleetPanel(BasePanel):
         self.status_data = {
             "sessions": 0, "model": "unknown", "gateway_status": "unknown",
         }
+        # Rendered table is reused across frames until the shown fields change
+        self._table = None
+        self._last_hash = None
 
     def update(self, agents_data, status_data, tokens_per_hour=None):
         """Update panel data from collectors."""
@@ -32,6 +35,19 @@ class AgentFleetPanel(BasePanel):
                         agent["tokens_per_hour"] = str(tph)
                 else:
                     agent["tokens_per_hour"] = "--"
+        h = self._fingerprint(self.agents_data)
+        if h != self._last_hash:
+            self._last_hash = h
+            self._table = None
+
+    @staticmethod
+    def _fingerprint(agents_data):
+        """Hash of the per-agent fields the table displays."""
+        return hash(tuple(
+            (a.get("name"), a.get("is_default"), a.get("model"), a.get("storage"),
+             a.get("tokens"), a.get("tokens_per_hour"), a.get("sessions"))
+            for a in agents_data.get("agents", [])
+        ))
 
     def _build_table(self, agents_data):
         """Build a Table from agent data."""
@@ -107,8 +123,9 @@ class AgentFleetPanel(BasePanel):
             return
 
         # Draw agent table
-        table = self._build_table(self.agents_data)
-        rows_drawn = table.draw(win, y, x, width, self.c_normal, self.c_error, self.c_warn)
+        if self._table is None:
+            self._table = self._build_table(self.agents_data)
+        rows_drawn = self._table.draw(win, y, x, width, self.c_normal, self.c_error, self.c_warn)
 
         # Summary below table
         summary_y = y + rows_drawn + 1
@@ -37,6 +37,28 @@ class StyledText:
             self._spans.append(self.Span(start, len(self._text), style))
         return self
 
+    @classmethod
+    def assemble(cls, *parts):
+        """Build from str or (text, style) parts with a single join.
+
+        Cheaper than repeated append() for content assembled in one go.
+        """
+        st = cls()
+        chunks = []
+        pos = 0
+        for part in parts:
+            if isinstance(part, str):
+                text, style = part, ""
+            else:
+                text, style = part
+            end = pos + len(text)
+            if style:
+                st._spans.append(cls.Span(pos, end, style))
+            chunks.append(text)
+            pos = end
+        st._text = "".join(chunks)
+        return st
+
     def __str__(self):
         return self._text
 
@@ -236,6 +258,10 @@ class BasePanel:
 
     TITLE = ""
 
+    # Smallest rectangle that fits the border plus a content row
+    MIN_HEIGHT = 3
+    MIN_WIDTH = 4
+
     # Box-drawing characters
     TL = "\u250c"  # ┌
     TR = "\u2510"  # ┐
@@ -251,7 +277,7 @@ class BasePanel:
     def draw(self, win, y, x, height, width, color_normal, color_highlight,
              color_warn, color_error, color_dim):
         """Draw the panel with box border and content into a curses window."""
-        if height < 3 or width < 4:
+        if height < self.MIN_HEIGHT or width < self.MIN_WIDTH:
             return
 
         # Store color pairs for subclasses
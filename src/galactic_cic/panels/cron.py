@@ -19,10 +19,26 @@ class CronJobsPanel(BasePanel):
     def __init__(self):
         super().__init__()
         self.cron_data = {"jobs": [], "error": None}
+        # Rendered table is reused across frames until the shown fields change
+        self._table = None
+        self._last_hash = None
 
     def update(self, cron_data):
         """Update panel data from collectors."""
         self.cron_data = cron_data or self.cron_data
+        h = self._fingerprint(self.cron_data)
+        if h != self._last_hash:
+            self._last_hash = h
+            self._table = None
+
+    @staticmethod
+    def _fingerprint(data):
+        """Hash of the per-job fields the table displays."""
+        return hash(tuple(
+            (j.get("name"), j.get("status"), j.get("error_count"),
+             j.get("last_run"), j.get("next_run"))
+            for j in data.get("jobs", [])
+        ))
 
     def _build_table(self, data):
         """Build a Table from cron data."""
@@ -97,8 +113,9 @@ class CronJobsPanel(BasePanel):
                 self._safe_addstr(win, y + 1, x, err_msg, self.c_error, width)
             return
 
-        table = self._build_table(self.cron_data)
-        rows_drawn = table.draw(win, y, x, width, self.c_normal, self.c_error, self.c_warn)
+        if self._table is None:
+            self._table = self._build_table(self.cron_data)
+        rows_drawn = self._table.draw(win, y, x, width, self.c_normal, self.c_error, self.c_warn)
 
         # Summary below table
         error_jobs = [j for j in jobs if j.get("status") == "error"]
@@ -10,6 +10,22 @@ from galactic_cic.panels.base import BasePanel, StyledText, Table
 
 ECM_COOLDOWN = 600  # 10 minutes in seconds
 
+# Fixed (text, style) fragments for the compact view, keyed by state
+_SSH_CLEAR = ("  SSH:  No intrusions\n", "green")
+_UFW_LINE = {True: ("  UFW: Active", "green"), False: ("  UFW: Inactive", "yellow")}
+_F2B_LINE = {
+    True: ("  Fail2ban: Active\n", "green"),
+    False: ("  Fail2ban: Inactive\n", "red"),
+}
+_ROOT_LINE = {
+    True: ("  RootLogin: Enabled", "yellow"),
+    False: ("  RootLogin: Disabled", "green"),
+}
+_NONE_LINE = ("   (none)\n", "green")
+_LOGINS_HEADING = ("  SSH Logins (24h):\n", "table_heading")
+_FAILED_HEADING = ("  SSH Failed (24h):\n", "table_heading")
+_SCANS_HEADING = ("  Attacker Scans:\n", "table_heading")
+
 
 class SecurityPanel(BasePanel):
     """Panel showing security status."""
@@ -40,6 +56,11 @@ class SecurityPanel(BasePanel):
         self.ecm_scan_target = ""
         self.ecm_last_scan_times = {}   # ip -> timestamp
 
+        # Content lines as (text, color role), rebuilt only when the data
+        # behind them changes
+        self._lines = None
+        self._last_hash = None
+
     def draw(self, win, y, x, height, width, color_normal, color_highlight,
              color_warn, color_error, color_dim):
         """Override to show [NMAP] indicator in title when scanning."""
@@ -79,6 +100,17 @@ class SecurityPanel(BasePanel):
             self.nmap_scanning = nmap_scanning
         if ecm_scans is not None:
             self.ecm_scans = ecm_scans
+        h = self._fingerprint()
+        if h != self._last_hash:
+            self._last_hash = h
+            self._lines = None
+
+    def _fingerprint(self):
+        """Hash of everything the compact content view shows."""
+        return hash(repr((
+            self.security_data, self.ssh_summary, self.last_nmap_time,
+            self.attacker_scans, self.geo_data,
+        )))
 
     def _can_scan(self, ip):
         last = self.ecm_last_scan_times.get(ip, 0)
@@ -160,20 +192,20 @@ class SecurityPanel(BasePanel):
 
     def _build_content(self, data):
         """Build content as StyledText — used by tests and rendering."""
-        st = StyledText()
+        parts = []
+        add = parts.append
 
         intrusions = data.get("ssh_intrusions", 0)
         if intrusions == 0:
-            st.append("  SSH:  No intrusions\n", "green")
-        elif intrusions < 10:
-            st.append(f"  SSH:  {intrusions} failed attempts\n", "yellow")
+            add(_SSH_CLEAR)
         else:
-            st.append(f"  SSH:  {intrusions} failed attempts\n", "red")
+            add((f"  SSH:  {intrusions} failed attempts\n",
+                 "yellow" if intrusions < 10 else "red"))
 
         # Port details as table
         ports_detail = data.get("ports_detail", [])
         port_count = len(ports_detail) if ports_detail else data.get("listening_ports", 0)
-        st.append(f"  Ports: {port_count} open\n", "green")
+        add((f"  Ports: {port_count} open\n", "green"))
 
         if ports_detail:
             table = Table(
@@ -190,89 +222,81 @@ class SecurityPanel(BasePanel):
             table_st = table.render()
             for line in table_st.plain.split("\n"):
                 if line.strip():
-                    st.append(f"    {line}\n", "green")
+                    add((f"    {line}\n", "green"))
 
-        st.append("\n")
+        add("\n")
 
         # SSH Login Summary with country codes
         accepted = self.ssh_summary.get("accepted", [])
         failed = self.ssh_summary.get("failed", [])
 
         if accepted:
-            st.append("  SSH Logins (24h):\n", "table_heading")
+            add(_LOGINS_HEADING)
             for entry in accepted:
                 ip = entry.get("ip", "?")
                 count = str(entry.get("count", 0))
                 host = entry.get("hostname", "unknown")[:13]
                 cc = self._get_cc(ip)
-                st.append(f"   {ip:<18}{count:>3} {host:<14}{cc}\n", "green")
+                add((f"   {ip:<18}{count:>3} {host:<14}{cc}\n", "green"))
 
-        st.append("  SSH Failed (24h):\n", "table_heading")
+        add(_FAILED_HEADING)
         if failed:
             for entry in failed:
                 ip = entry.get("ip", "?")
                 count = str(entry.get("count", 0))
                 host = entry.get("hostname", "unknown")[:13]
                 cc = self._get_cc(ip)
-                st.append(f"   {ip:<18}{count:>3} {host:<14}{cc}\n", "red")
+                add((f"   {ip:<18}{count:>3} {host:<14}{cc}\n", "red"))
                 # Show nmap scan results if available
                 scan = self.attacker_scans.get(ip, {})
                 ports = scan.get("open_ports", "")
                 os_guess = scan.get("os_guess", "")
                 if ports or os_guess:
-                    parts = []
+                    details = []
                     if ports:
-                        parts.append(f"ports: {ports}")
+                        details.append(f"ports: {ports}")
                     if os_guess:
-                        parts.append(f"os: {os_guess}")
-                    st.append(f"     {('  '.join(parts))}\n", "red")
+                        details.append(f"os: {os_guess}")
+                    add((f"     {('  '.join(details))}\n", "red"))
         else:
-            st.append("   (none)\n", "green")
-
-        st.append("\n")
-
-        # UFW + Fail2ban on same line
-        ufw_status = "Active" if data.get("ufw_active", False) else "Inactive"
-        f2b_status = "Active" if data.get("fail2ban_active", False) else "Inactive"
-        ufw_style = "green" if data.get("ufw_active") else "yellow"
-        f2b_style = "green" if data.get("fail2ban_active") else "red"
-        st.append(f"  UFW: {ufw_status}", ufw_style)
-        st.append(f"  Fail2ban: {f2b_status}\n", f2b_style)
-
-        # Root login
-        root_enabled = data.get("root_login_enabled", True)
-        if root_enabled:
-            st.append("  RootLogin: Enabled", "yellow")
-        else:
-            st.append("  RootLogin: Disabled", "green")
+            add(_NONE_LINE)
+
+        add("\n")
 
-        st.append("\n")
+        # UFW + Fail2ban on same line, then root login
+        add(_UFW_LINE[bool(data.get("ufw_active", False))])
+        add(_F2B_LINE[bool(data.get("fail2ban_active", False))])
+        add(_ROOT_LINE[bool(data.get("root_login_enabled", True))])
+
+        add("\n")
 
         # Attacker Scan Summary
         if self.attacker_scans:
-            st.append("  Attacker Scans:\n", "table_heading")
+            add(_SCANS_HEADING)
             if self.last_nmap_time:
-                st.append(f"  Last scan: {self.last_nmap_time}\n", "green")
+                add((f"  Last scan: {self.last_nmap_time}\n", "green"))
             for ip, scan in self.attacker_scans.items():
                 ports = scan.get("open_ports", "none")
                 os_guess = scan.get("os_guess", "")
                 cc = self._get_cc(ip)
-                st.append(f"   {ip:<18}", "red")
-                st.append(f" [{cc}]", "yellow")
+                add((f"   {ip:<18}", "red"))
+                add((f" [{cc}]", "yellow"))
                 if ports and ports != "none":
-                    st.append(f"  ports: {ports}", "red")
+                    add((f"  ports: {ports}", "red"))
                 if os_guess:
-                    st.append(f"  os: {os_guess}", "red")
-                st.append("\n")
+                    add((f"  os: {os_guess}", "red"))
+                add("\n")
         elif self.last_nmap_time:
-            st.append(f"  Last nmap: {self.last_nmap_time}  No attackers scanned\n", "green")
+            add((f"  Last nmap: {self.last_nmap_time}  No attackers scanned\n", "green"))
 
-        return st
+        return StyledText.assemble(*parts)
+
+    def _content_lines(self):
+        """(line, color role) pairs for the compact view, built once per change."""
+        if self._lines is not None:
+            return self._lines
 
-    def _draw_content(self, win, y, x, height, width):
-        """Render security status content into curses window."""
         st = self._build_content(self.security_data)
-        lines = st.plain.split("\n")
 
         # Build a set of failed IPs for quick lookup
         failed_ips = set()
@@ -281,29 +305,43 @@ class SecurityPanel(BasePanel):
             if ip:
                 failed_ips.add(ip)
 
-        for i, line in enumerate(lines[:height]):
-            if not line:
-                continue
-            attr = self.c_normal
+        lines = []
+        for line in st.plain.split("\n"):
+            role = "normal"
             if "SSH Logins" in line or "SSH Failed" in line or "Attacker Scans" in line:
-                attr = self.c_table_heading
+                role = "table_heading"
             elif "Last scan:" in line or "Last nmap:" in line:
-                attr = self.c_normal
+                role = "normal"
             elif "failed attempts" in line:
                 intrusions = self.security_data.get("ssh_intrusions", 0)
-                attr = self.c_error if intrusions >= 10 else self.c_warn
+                role = "error" if intrusions >= 10 else "warn"
             elif "Inactive" in line:
                 if "Fail2ban" in line:
-                    attr = self.c_error
+                    role = "error"
                 elif "UFW" in line:
-                    attr = self.c_warn
+                    role = "warn"
             elif "Enabled" in line:
-                attr = self.c_warn
+                role = "warn"
             elif "ports:" in line or "os:" in line:
-                attr = self.c_error
+                role = "error"
             elif any(ip in line for ip in failed_ips):
-                attr = self.c_error
-            self._safe_addstr(win, y + i, x, line, attr, width)
+                role = "error"
+            lines.append((line, role))
+        self._lines = lines
+        return lines
+
+    def _draw_content(self, win, y, x, height, width):
+        """Render security status content into curses window."""
+        attrs = {
+            "normal": self.c_normal,
+            "table_heading": self.c_table_heading,
+            "warn": self.c_warn,
+            "error": self.c_error,
+        }
+        for i, (line, role) in enumerate(self._content_lines()[:height]):
+            if not line:
+                continue
+            self._safe_addstr(win, y + i, x, line, attrs[role], width)
 
     def _draw_detail(self, win, y, x, height, width):
         """Full-screen detail view for Security."""
@@ -115,6 +115,10 @@ _initialized = False
 
 _dark_green_available = False
 
+# (theme name, role) -> resolved attr; get_attr runs for every drawn line,
+# so it is memoized and cleared whenever init_colors() redefines the pairs
+_attr_cache = {}
+
 
 def _resolve_color(name):
     """Resolve a string color name to a curses constant.
@@ -206,6 +210,7 @@ def init_colors(theme_name=None):
         fg_name, bg_name = theme.colors.get(role, ("green", "black"))
         curses.init_pair(pair_id, _resolve_color(fg_name), _resolve_color(bg_name))
 
+    _attr_cache.clear()
     _initialized = True
 
 
@@ -217,6 +222,11 @@ def get_attr(role):
     if not _initialized:
         return 0
 
+    key = (_current_theme_name, role)
+    attr = _attr_cache.get(key)
+    if attr is not None:
+        return attr
+
     pair_id = PAIR_IDS.get(role, PAIR_IDS[NORMAL])
     attr = curses.color_pair(pair_id)
 
@@ -224,6 +234,7 @@ def get_attr(role):
     for attr_name in theme.attrs.get(role, []):
         attr |= _resolve_attr(attr_name)
 
+    _attr_cache[key] = attr
     return attr
 
 
@@ -5,16 +5,33 @@ import os
 import tempfile
 import time
 import unittest
+from unittest.mock import patch
 
 from galactic_cic.data.collectors import (
     run_command,
+    cached_command,
+    clear_command_cache,
+    _run_first,
+    clear_lookup_memos,
+    resolve_ip,
     get_server_health,
     get_agents_data,
     get_cron_jobs,
     get_security_status,
     get_activity_log,
+    get_openclaw_status,
+    get_network_activity,
+    get_ssh_login_summary,
     _parse_size,
     _parse_storage_bytes,
+    _human_size,
+    _tail_lines,
+    _format_uptime,
+    _parse_agents_list,
+    _parse_openclaw_events,
+    _event_ts,
+    _split_ssh_lines,
+    _tally_ssh_ips,
 )
 from galactic_cic.db.database import MetricsDB
 from galactic_cic.db.recorder import MetricsRecorder
@@ -46,6 +63,117 @@ class TestRunCommand(unittest.TestCase):
         )
         self.assertNotEqual(rc, 0)
 
+    def test_argv_command(self):
+        stdout, stderr, rc = asyncio.run(run_command(["echo", "a b"]))
+        self.assertEqual(rc, 0)
+        self.assertEqual(stdout.strip(), "a b")
+
+    def test_argv_missing_binary(self):
+        stdout, stderr, rc = asyncio.run(run_command(["nonexistent_command_xyz"]))
+        self.assertEqual((stdout, stderr, rc), ("", "", 127))
+
+    def test_max_lines_stops_endless_output(self):
+        stdout, stderr, rc = asyncio.run(
+            run_command(["yes", "x"], timeout=5.0, max_lines=3)
+        )
+        self.assertEqual(rc, 0)
+        self.assertEqual(stdout, "x\nx\nx\n")
+
+    def test_max_lines_short_output(self):
+        stdout, stderr, rc = asyncio.run(run_command("echo one", max_lines=5))
+        self.assertEqual((stdout, rc), ("one\n", 0))
+
+    def test_max_lines_exact_output_keeps_exit_status(self):
+        stdout, stderr, rc = asyncio.run(
+            run_command(["sh", "-c", "seq 3; exit 3"], max_lines=3)
+        )
+        self.assertEqual((stdout, rc), ("1\n2\n3\n", 3))
+
+    def test_concurrent_duplicates_share_one_run(self):
+        async def both():
+            cmd = "date +%s%N; sleep 0.2"
+            return await asyncio.gather(run_command(cmd), run_command(cmd))
+
+        first, second = asyncio.run(both())
+        self.assertEqual(first, second)
+
+
+class TestCachedCommand(unittest.TestCase):
+    """Test the TTL-memoized command wrapper."""
+
+    def setUp(self):
+        clear_command_cache()
+
+    def tearDown(self):
+        clear_command_cache()
+
+    def test_reuses_result_within_ttl(self):
+        cmd = "date +%s%N"
+        first = asyncio.run(cached_command(cmd, ttl=60))
+        second = asyncio.run(cached_command(cmd, ttl=60))
+        self.assertEqual(first, second)
+
+    def test_expired_entry_reruns(self):
+        cmd = "date +%s%N"
+        first = asyncio.run(cached_command(cmd, ttl=0))
+        second = asyncio.run(cached_command(cmd, ttl=0))
+        self.assertNotEqual(first[0], second[0])
+
+    def test_clear_forces_rerun(self):
+        cmd = "date +%s%N"
+        first = asyncio.run(cached_command(cmd, ttl=60))
+        clear_command_cache()
+        second = asyncio.run(cached_command(cmd, ttl=60))
+        self.assertNotEqual(first[0], second[0])
+
+
+class TestRunFirst(unittest.TestCase):
+    """Test the Python-side `a || b` fallback chain."""
+
+    def setUp(self):
+        clear_command_cache()
+
+    def tearDown(self):
+        clear_command_cache()
+
+    def test_remembers_working_variant(self):
+        calls = []
+
+        async def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return ("ok", "", 0) if cmd == ["new"] else ("", "", 1)
+
+        with patch("galactic_cic.data.collectors.run_command", side_effect=mock_run):
+            first = asyncio.run(_run_first(["old"], ["new"]))
+            second = asyncio.run(_run_first(["old"], ["new"]))
+        self.assertEqual(first, ("ok", "", 0))
+        self.assertEqual(second, ("ok", "", 0))
+        self.assertEqual(calls, [["old"], ["new"], ["new"]])
+
+
+class TestLookupMemo(unittest.TestCase):
+    """Test the in-process DNS memo in front of the DB cache."""
+
+    def setUp(self):
+        clear_lookup_memos()
+
+    def tearDown(self):
+        clear_lookup_memos()
+
+    def test_repeat_lookup_skips_command(self):
+        calls = []
+
+        async def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return ("host.example.com.\n", "", 0)
+
+        with patch("galactic_cic.data.collectors.run_command", side_effect=mock_run):
+            first = asyncio.run(resolve_ip("203.0.113.5"))
+            second = asyncio.run(resolve_ip("203.0.113.5"))
+        self.assertEqual(first, "host.example.com")
+        self.assertEqual(second, "host.example.com")
+        self.assertEqual(len(calls), 1)
+
 
 class TestParseSize(unittest.TestCase):
     """Test size string parsing."""
@@ -62,6 +190,10 @@ class TestParseSize(unittest.TestCase):
     def test_invalid(self):
         self.assertEqual(_parse_size("abc"), 0.0)
 
+    def test_empty_and_bare_bytes(self):
+        self.assertEqual(_parse_size(""), 0.0)
+        self.assertAlmostEqual(_parse_size(str(2 * 1024 ** 3)), 2.0)
+
 
 class TestParseStorageBytes(unittest.TestCase):
     """Test storage bytes parsing."""
@@ -77,6 +209,91 @@ class TestParseStorageBytes(unittest.TestCase):
         self.assertEqual(_parse_storage_bytes("abc"), 0)
 
 
+class TestProcFormatting(unittest.TestCase):
+    """Test df/uptime-style formatting of /proc readings."""
+
+    def test_human_size(self):
+        self.assertEqual(_human_size(500 * 1024 ** 2), "500M")
+        self.assertEqual(_human_size(5.9 * 1024 ** 3), "5.9G")
+        self.assertEqual(_human_size(252 * 1024 ** 3), "252G")
+
+    def test_uptime_minutes(self):
+        self.assertEqual(_format_uptime(600), "10 min")
+
+    def test_uptime_days(self):
+        self.assertEqual(_format_uptime(3 * 86400 + 4 * 3600 + 5 * 60), "3 days, 4:05")
+        self.assertEqual(_format_uptime(86400 + 60), "1 day, 1 min")
+
+    def test_tail_lines_reads_window_from_end(self):
+        with tempfile.NamedTemporaryFile("w", delete=False) as f:
+            f.write("".join(f"line {i}\n" for i in range(1000)))
+        try:
+            lines = _tail_lines(f.name, 3, block_size=16)
+            self.assertEqual(lines, ["line 997", "line 998", "line 999"])
+            self.assertEqual(len(_tail_lines(f.name, 5000)), 1000)
+        finally:
+            os.unlink(f.name)
+
+    def test_tail_lines_missing_file(self):
+        self.assertEqual(_tail_lines("/nonexistent/auth.log", 10), [])
+
+
+class TestOutputParsers(unittest.TestCase):
+    """Test the pure parsers behind the collectors."""
+
+    def test_parse_agents_list(self):
+        text = (
+            "Agents:\n"
+            "- main (default) (galactic)\n"
+            "  Model: anthropic/claude-opus\n"
+            "  Workspace: ~/work/main\n"
+            "- helper\n"
+            "  Model: gpt-4o\n"
+        )
+        agents = _parse_agents_list(text)
+        self.assertEqual([a["name"] for a in agents], ["main", "helper"])
+        self.assertTrue(agents[0]["is_default"])
+        self.assertEqual(agents[0]["model"], "opus")
+        self.assertEqual(agents[0]["workspace"], "~/work/main")
+        self.assertEqual(agents[1]["workspace"], "")
+
+    def test_parse_openclaw_events_json(self):
+        events = _parse_openclaw_events('[{"time": "12:00", "text": "hi"}]')
+        self.assertEqual(events[0]["message"], "hi")
+        self.assertEqual(events[0]["type"], "openclaw")
+
+    def test_parse_openclaw_events_text(self):
+        events = _parse_openclaw_events("started\n\nstopped\n")
+        self.assertEqual([e["message"] for e in events], ["started", "stopped"])
+
+    def test_event_ts_orders_mixed_formats(self):
+        from datetime import datetime, timedelta
+        earlier = (datetime.now() - timedelta(hours=1)).strftime("%b %d %H:%M:%S")
+        later = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        self.assertLess(_event_ts(earlier), _event_ts(later))
+        self.assertGreater(_event_ts("00:00"), 0)
+        self.assertEqual(_event_ts("unknown"), 0.0)
+
+    def test_syslog_ts_never_in_future(self):
+        from datetime import datetime, timedelta
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%b %d %H:%M:%S")
+        self.assertLess(_event_ts(tomorrow), time.time())
+
+    def test_split_and_tally_ssh_lines(self):
+        text = (
+            "Feb 20 10:00:01 host sshd[1]: Failed password for root from 1.2.3.4 port 22\n"
+            "Feb 20 10:00:02 host sshd[1]: Invalid user bob from 1.2.3.4 port 22\n"
+            "Feb 20 10:00:03 host sshd[1]: Failed password for root from 5.6.7.8 port 22\n"
+            "Feb 20 10:05:00 host sshd[2]: Accepted publickey for me from 9.9.9.9 port 22\n"
+        )
+        accepted, failed = _split_ssh_lines(text)
+        self.assertEqual(len(accepted), 1)
+        self.assertEqual(len(failed), 3)
+        top = _tally_ssh_ips(failed)
+        self.assertEqual(top[0], {"ip": "1.2.3.4", "count": 2, "last_seen": "Feb 20 10:00:02"})
+        self.assertEqual(top[1]["ip"], "5.6.7.8")
+
+
 class TestCollectors(unittest.TestCase):
     """Test collector functions handle graceful failures."""
 
@@ -92,6 +309,13 @@ class TestCollectors(unittest.TestCase):
         self.assertIn("disk_used_gb", result)
         self.assertIn("disk_total_gb", result)
 
+    @unittest.skipUnless(os.path.exists("/proc/meminfo"), "needs /proc")
+    def test_server_health_reads_proc(self):
+        result = asyncio.run(get_server_health())
+        self.assertGreater(result["mem_total_mb"], 0)
+        self.assertGreater(result["disk_total_gb"], 0)
+        self.assertNotEqual(result["uptime"], "unknown")
+
     def test_agents_data_returns_dict(self):
         result = asyncio.run(get_agents_data())
         self.assertIsInstance(result, dict)
@@ -111,6 +335,98 @@ class TestCollectors(unittest.TestCase):
         result = asyncio.run(get_activity_log())
         self.assertIsInstance(result, list)
 
+    def test_network_activity_counts_peers(self):
+        ss_out = (
+            "State  Recv-Q Send-Q Local Address:Port  Peer Address:Port\n"
+            "ESTAB  0      0      10.0.0.2:22         203.0.113.5:51000\n"
+            "ESTAB  0      0      10.0.0.2:22         203.0.113.5:51001\n"
+            "ESTAB  0      0      127.0.0.1:5432      127.0.0.1:40000\n"
+            "ESTAB  0      0      [::ffff:10.0.0.2]:443 [2001:db8::1]:6000\n"
+        )
+        calls = []
+
+        async def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return (ss_out, "", 0)
+
+        with patch("galactic_cic.data.collectors.run_command", side_effect=mock_run):
+            result = asyncio.run(get_network_activity())
+        self.assertEqual(calls, [["ss", "-tn"]])
+        self.assertEqual(result["active_connections"], 3)
+        self.assertEqual(result["peer_ips"], {"203.0.113.5": 2, "2001:db8::1": 1})
+
+    def test_ssh_intrusions_counted_by_grep(self):
+        async def mock_run(cmd, **kwargs):
+            if cmd[:2] == ["grep", "-c"]:
+                return ("123456\n", "", 0)
+            return ("", "", 1)
+
+        clear_command_cache()
+        with patch("galactic_cic.data.collectors.run_command", side_effect=mock_run):
+            result = asyncio.run(get_security_status())
+        clear_command_cache()
+        self.assertEqual(result["ssh_intrusions"], 123456)
+
+    def test_ssh_login_summary_reads_bounded_window(self):
+        calls = []
+
+        async def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return (
+                "Feb 20 10:05:00 host sshd[2]: Accepted publickey for me from 9.9.9.9 port 22\n"
+                "Feb 20 10:00:01 host sshd[1]: Failed password for root from 1.2.3.4 port 22\n",
+                "", 0,
+            )
+
+        clear_command_cache()
+        with patch("galactic_cic.data.collectors.run_command", side_effect=mock_run):
+            result = asyncio.run(get_ssh_login_summary())
+        clear_command_cache()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].count("tail -500"), 2)
+        self.assertEqual(result["accepted"][0]["ip"], "9.9.9.9")
+        self.assertEqual(result["failed"][0]["ip"], "1.2.3.4")
+
+
+class TestOpenclawStatus(unittest.TestCase):
+    """Test that get_openclaw_status forks only what the JSON lacks."""
+
+    def setUp(self):
+        clear_command_cache()
+
+    def tearDown(self):
+        clear_command_cache()
+
+    def _collect(self, status_json):
+        calls = []
+
+        async def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            if cmd == ["openclaw", "status", "--json"]:
+                return (status_json, "", 0)
+            if cmd == ["openclaw", "gateway", "status"]:
+                return ("Gateway: running", "", 0)
+            return ("2.0.1\n", "", 0)
+
+        with patch("galactic_cic.data.collectors.run_command", side_effect=mock_run):
+            result = asyncio.run(get_openclaw_status())
+        return result, calls
+
+    def test_json_with_gateway_and_version_skips_subcommands(self):
+        result, calls = self._collect(
+            '{"sessions": 2, "gateway": {"status": "running"}, "version": "2.1.0"}'
+        )
+        self.assertEqual(calls, [["openclaw", "status", "--json"]])
+        self.assertEqual(result["gateway_status"], "running")
+        self.assertEqual(result["version"], "2.1.0")
+
+    def test_falls_back_to_subcommands(self):
+        result, calls = self._collect('{"sessions": 2}')
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(result["sessions"], 2)
+        self.assertEqual(result["gateway_status"], "running")
+        self.assertEqual(result["version"], "2.0.1")
+
 
 class TestMetricsDB(unittest.TestCase):
     """Test the SQLite metrics database."""
@@ -163,6 +479,42 @@ class TestMetricsDB(unittest.TestCase):
         self.assertEqual(row["tokens_used"], 126000)
         self.assertEqual(row["sessions"], 3)
 
+    def test_recent_server_columns(self):
+        ts = time.time()
+        for offset, cpu, mem_used in ((20, 10.0, 1000.0), (10, 30.0, 2000.0)):
+            self.db.execute(
+                "INSERT INTO server_metrics "
+                "(timestamp, cpu_percent, mem_used_mb, mem_total_mb, "
+                "disk_used_gb, disk_total_gb) VALUES (?, ?, ?, ?, ?, ?)",
+                (ts - offset, cpu, mem_used, 4000.0, 10.0, 0.0),
+            )
+        self.db.commit()
+        cols = self.db.get_recent_server_columns(hours=1, limit=20)
+        self.assertEqual(cols["cpu"], [10.0, 30.0])
+        self.assertEqual(cols["mem"], [25.0, 50.0])
+        self.assertEqual(cols["disk"], [0, 0])
+
+    def test_recent_server_columns_empty(self):
+        cols = self.db.get_recent_server_columns()
+        self.assertEqual(cols, {"cpu": [], "mem": [], "disk": []})
+
+    def test_batch_commits_once_on_exit(self):
+        import sqlite3
+        other = sqlite3.connect(self.db_path)
+        try:
+            with self.db.batch():
+                self.db.execute(
+                    "INSERT INTO server_metrics (timestamp, cpu_percent) VALUES (?, ?)",
+                    (time.time(), 50.0),
+                )
+                self.db.commit()  # deferred inside the batch
+                count = other.execute("SELECT COUNT(*) FROM server_metrics").fetchone()[0]
+                self.assertEqual(count, 0)
+            count = other.execute("SELECT COUNT(*) FROM server_metrics").fetchone()[0]
+            self.assertEqual(count, 1)
+        finally:
+            other.close()
+
     def test_prune_old_records(self):
         old_ts = time.time() - (31 * 24 * 3600)  # 31 days ago
         self.db.execute(
@@ -221,6 +573,15 @@ class TestMetricsRecorder(unittest.TestCase):
         row = self.db.fetchone("SELECT * FROM server_metrics")
         self.assertAlmostEqual(row["cpu_percent"], 23.0)
 
+    def test_record_refresh_stats(self):
+        self.recorder.record_refresh_stats(
+            {"duration_ms": 420, "tasks_run": 6, "failures": 1}
+        )
+        row = self.db.fetchone("SELECT * FROM refresh_stats")
+        self.assertEqual(row["duration_ms"], 420)
+        self.assertEqual(row["tasks_run"], 6)
+        self.assertEqual(row["failures"], 1)
+
     def test_record_security(self):
         self.recorder.record_security({
             "ssh_intrusions": 5, "listening_ports": 4,
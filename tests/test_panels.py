@@ -682,6 +682,46 @@ class TestAgentPanel(unittest.TestCase):
         self.assertIn("Error loading agents", st.plain)
 
 
+# ---------------------------------------------------------------------------
+# Panel content cache tests (agent, cron, security)
+# ---------------------------------------------------------------------------
+
+class TestPanelTableCache(unittest.TestCase):
+    """Agent/cron tables and security lines are rebuilt only on display changes."""
+
+    def test_agent_table_kept_when_unchanged(self):
+        panel = AgentFleetPanel()
+        data = {"agents": [{"name": "main", "model": "opus", "sessions": 1}]}
+        panel.update(data, {"sessions": 1})
+        panel._table = sentinel = object()
+        panel.update({"agents": [{"name": "main", "model": "opus", "sessions": 1}]},
+                     {"sessions": 1})
+        self.assertIs(panel._table, sentinel)
+        panel.update({"agents": [{"name": "main", "model": "opus", "sessions": 2}]},
+                     {"sessions": 2})
+        self.assertIsNone(panel._table)
+
+    def test_cron_table_dropped_on_status_change(self):
+        panel = CronJobsPanel()
+        panel.update({"jobs": [{"name": "backup", "status": "ok"}]})
+        panel._table = sentinel = object()
+        panel.update({"jobs": [{"name": "backup", "status": "ok"}]})
+        self.assertIs(panel._table, sentinel)
+        panel.update({"jobs": [{"name": "backup", "status": "error"}]})
+        self.assertIsNone(panel._table)
+
+    def test_security_lines_kept_when_unchanged(self):
+        panel = SecurityPanel()
+        data = {"ssh_intrusions": 3, "ports_detail": []}
+        panel.update(dict(data), ssh_summary={"accepted": [], "failed": []})
+        lines = panel._content_lines()
+        panel.update(dict(data), ssh_summary={"accepted": [], "failed": []})
+        self.assertIs(panel._content_lines(), lines)
+        panel.update({"ssh_intrusions": 12, "ports_detail": []})
+        self.assertIsNot(panel._content_lines(), lines)
+        self.assertIn(("  SSH:  12 failed attempts", "error"), panel._content_lines())
+
+
 # ---------------------------------------------------------------------------
 # Security panel tests
 # ---------------------------------------------------------------------------
@@ -819,6 +859,12 @@ class TestStyledTextMerge(unittest.TestCase):
         st.append("world", "red")
         self.assertEqual(st.plain, "hello world")
 
+    def test_assemble_matches_append(self):
+        st = StyledText.assemble(("hello ", "green"), "plain ", ("world", "red"))
+        self.assertEqual(st.plain, "hello plain world")
+        self.assertEqual([(sp.start, sp.end, sp.style) for sp in st._spans],
+                         [(0, 6, "green"), (12, 17, "red")])
+
 
 # ---------------------------------------------------------------------------
 # Cron parser tests (Doctor diagnostic output filtering)
@@ -827,6 +873,10 @@ class TestStyledTextMerge(unittest.TestCase):
 class TestCronParserDoctorOutput(unittest.TestCase):
     """Test get_cron_jobs handles Doctor diagnostic output before table."""
 
+    def setUp(self):
+        from galactic_cic.data.collectors import clear_command_cache
+        clear_command_cache()
+
     def test_skips_doctor_output(self):
         """Parser should skip Doctor diagnostic box and find the real header."""
         import asyncio
@@ -1069,6 +1119,32 @@ class TestActivityIPSummary(unittest.TestCase):
         self.assertEqual(len(panel.ext_ip_summary), 1)
 
 
+class TestActivityFormatCache(unittest.TestCase):
+    """Test activity lines are formatted once per update, not per frame."""
+
+    EVENTS = [
+        {"time": "12:00", "message": "login ok", "type": "ssh", "level": "info"},
+        {"time": "12:01", "message": "job failed", "type": "cron", "level": "error"},
+    ]
+
+    def test_lines_reused_between_frames(self):
+        panel = ActivityLogPanel()
+        panel.update(self.EVENTS)
+        first = panel._formatted_recent()
+        self.assertIs(panel._formatted_recent(), first)
+        self.assertEqual(first[1][1], "error")
+        self.assertIn("[cron] job failed", first[1][0])
+
+    def test_update_and_filter_invalidate(self):
+        panel = ActivityLogPanel()
+        panel.update(self.EVENTS)
+        self.assertEqual(len(panel._formatted_recent()), 2)
+        panel.set_filter("cron")
+        self.assertEqual(len(panel._formatted_recent()), 1)
+        panel.update(self.EVENTS[:1])
+        self.assertEqual(len(panel._formatted_recent()), 0)
+
+
 
 # ---------------------------------------------------------------------------
 # SITREP panel tests